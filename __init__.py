@@ -1,5 +1,7 @@
 # __init__.py
 
+# Blender reads bl_info with ast.literal_eval without importing the module,
+# so it has to stay a plain dict literal (no imports, merges or names).
 bl_info = {
     "name": "AI Scene Generator (Modular)",
     "author": "Your Name",
@@ -12,40 +14,47 @@ bl_info = {
     "category": "3D View",
 }
 
-import bpy
+import sys
+import itertools
 from . import properties
 from . import ui_panel
 from . import operator
-from . import database
-from . import asset_scanner
-from . import backend
-from . import limit_manager
+from ._registration import make_register
 
-# A list of all modules that contain classes to register
-modules = (
-    properties,
-    ui_panel,
-    operator,
-)
+# database, asset_scanner and backend are imported on first use so enabling
+# the add-on does not pay for them up front.
+
+# Every class to register, flattened once at import time
+classes = tuple(itertools.chain(
+    properties.classes,
+    ui_panel.classes,
+    operator.classes,
+))
 
-def register():
-    for mod in modules:
-        mod.register()
-    
-    bpy.types.Scene.my_tool_properties = bpy.props.PointerProperty(type=properties.MySceneProperties)
-    
-    # Initialize the asset intelligence database
+def _init_db_once():
+    """
+    One-shot timer that initializes the asset intelligence database.
+    Serves the database from the previous session immediately and
+    revalidates its schema in the background.
+    """
     try:
-        db = database.get_database()
-        print("Asset Intelligence Database initialized successfully")
+        from . import database
+        database.load_cached_handle()
+        database.refresh_in_background()
+        print("Asset Intelligence Database initialization started")
     except Exception as e:
         print(f"Warning: Could not initialize asset database: {e}")
+    return None  # Unregister timer
 
-def unregister():
-    for mod in reversed(modules):
-        mod.unregister()
-        
-    del bpy.types.Scene.my_tool_properties
-    
-    # Reset database instance
-    database.reset_database()
\ No newline at end of file
+def _reset_database():
+    """Reset database instance (only if it was loaded this session)."""
+    database = sys.modules.get(f"{__name__}.database")
+    if database is not None:
+        database.reset_database()
+
+register, unregister = make_register(
+    classes,
+    scene_properties=properties.MySceneProperties,
+    extras=(_init_db_once,),
+    on_unregister=(operator.stop_scan_timer, _reset_database),
+)
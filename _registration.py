@@ -0,0 +1,45 @@
+# _registration.py - Shared register/unregister plumbing for the add-on entry point
+
+import bpy
+
+
+def make_register(classes, scene_properties=None, extras=(), on_unregister=()):
+    """
+    Build the add-on's register/unregister pair.
+
+    Args:
+        classes: Flat tuple of every class to register, in registration order
+        scene_properties: PropertyGroup attached as Scene.my_tool_properties
+        extras: Callbacks run once from a one-shot timer after registration
+                (e.g. database initialization); must return None
+        on_unregister: Callbacks run at the end of unregister()
+
+    Returns:
+        (register, unregister) tuple
+    """
+    register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+    def register():
+        register_classes()
+
+        if scene_properties is not None:
+            bpy.types.Scene.my_tool_properties = bpy.props.PointerProperty(type=scene_properties)
+
+        # Deferred work runs after registration returns, off the enable path
+        for callback in extras:
+            bpy.app.timers.register(callback, first_interval=0.1)
+
+    def unregister():
+        for callback in extras:
+            if bpy.app.timers.is_registered(callback):
+                bpy.app.timers.unregister(callback)
+
+        unregister_classes()
+
+        if scene_properties is not None:
+            del bpy.types.Scene.my_tool_properties
+
+        for callback in on_unregister:
+            callback()
+
+    return register, unregister
@@ -10,10 +10,19 @@ import logging
 import time
 import subprocess
 import tempfile
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
 import bpy
 
+# orjson is optional; results are parsed with the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Handle both relative and absolute imports (for standalone and addon usage)
 try:
     from .database import get_database, AssetDatabase
@@ -24,6 +33,143 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data) -> Any:
+    """Parse a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class BlenderWorker:
+    """
+    Long-lived background Blender process answering extraction requests.
+
+    Requests are JSON lines written to the process's stdin; responses are
+    JSON lines on stdout tagged with RESPONSE_PREFIX so they can be told
+    apart from Blender's own console output. Startup is paid once per
+    worker instead of once per file. The process is restarted on demand
+    after a crash or timeout.
+    """
+
+    RESPONSE_PREFIX = "@@AIGEN_RPC@@"
+
+    def __init__(self, blender_executable: str, script_path: str, startup_timeout: float = 120):
+        self.blender_executable = blender_executable
+        self.script_path = script_path
+        self.startup_timeout = startup_timeout
+        self.process = None
+        self._responses = None
+        self._output_tail = deque(maxlen=50)  # Recent non-RPC output for error reports
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Launch Blender and wait for the driver script to report ready."""
+        self._responses = queue.Queue()
+        self._output_tail.clear()
+        self.process = subprocess.Popen(
+            [self.blender_executable, "--background", "--python", self.script_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT  # One pipe, so a full stderr buffer can't stall Blender
+        )
+
+        # select() doesn't work on Windows pipes, so a reader thread feeds a
+        # queue and call() waits on it with a timeout instead
+        reader = threading.Thread(
+            target=self._read_output,
+            args=(self.process, self._responses),
+            name="BlenderWorkerReader",
+            daemon=True
+        )
+        reader.start()
+
+        self._wait_for_response(self.startup_timeout)
+        logger.debug(f"Blender worker started (pid {self.process.pid})")
+
+    def _read_output(self, process, responses):
+        """Split worker output into RPC responses and console output."""
+        # Output stays bytes: responses go straight to the JSON parser and
+        # console lines are only decoded if an error report needs them
+        prefix = self.RESPONSE_PREFIX.encode('utf-8')
+        for line in process.stdout:
+            # Blender's C-side output is block-buffered and can flush half a
+            # line just before a response, so the prefix isn't always first
+            index = line.find(prefix)
+            if index < 0:
+                self._output_tail.append(line.rstrip())
+                continue
+            if index > 0:
+                self._output_tail.append(line[:index].rstrip())
+            try:
+                responses.put(_json_loads(line[index + len(prefix):]))
+            except ValueError as e:
+                responses.put({"error": f"Malformed worker response: {e}", "success": False})
+        responses.put(None)  # EOF: the process exited
+
+    def call(self, op: str, timeout: float = 120, **args) -> Dict[str, Any]:
+        """Send one request and wait for its response."""
+        if not self.is_alive():
+            self.start()
+
+        request = dict(args, op=op)
+        try:
+            self.process.stdin.write(json.dumps(request).encode('utf-8') + b"\n")
+            self.process.stdin.flush()
+        except OSError as e:
+            self.close()
+            raise Exception(f"Blender worker unavailable: {e}")
+
+        return self._wait_for_response(timeout)
+
+    def _wait_for_response(self, timeout: float) -> Dict[str, Any]:
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            # A hung worker won't answer a shutdown request either
+            self.kill()
+            raise Exception(f"Blender worker timeout after {timeout}s")
+
+        if response is None:
+            return_code = self.kill()
+            output = "\n".join(line.decode('utf-8', errors='replace') for line in self._output_tail)
+            raise Exception(f"Blender worker exited (code {return_code})\nOUTPUT (last lines): {output[-1000:]}")
+
+        return response
+
+    def close(self):
+        """Ask the worker to exit, killing it if it doesn't."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+
+        try:
+            if process.poll() is None:
+                process.stdin.write(b'{"op": "shutdown"}\n')
+                process.stdin.flush()
+                process.wait(timeout=10)
+        except Exception:
+            process.kill()
+            process.wait()
+
+    def kill(self) -> Optional[int]:
+        """Terminate the worker immediately; returns its exit code."""
+        process, self.process = self.process, None
+        if process is None:
+            return None
+        if process.poll() is None:
+            process.kill()
+        return process.wait()
+
+
 class RobustAssetScanner:
     """
     Asset scanner with accurate dimension calculations.
@@ -31,12 +177,28 @@ class RobustAssetScanner:
     """
 
     LARGE_FILE_THRESHOLD = 500 * 1024 * 1024  # 500 MB threshold for per-collection extraction
+    SKIPPED_DIRECTORIES = ('backup', 'temp', 'cache', '__pycache__')
+    MAX_CONCURRENT_LARGE_FILES = 1  # Each large file can hold several GB in Blender
 
-    def __init__(self, database: AssetDatabase = None):
+    def __init__(self, database: AssetDatabase = None, max_workers: Optional[int] = None):
         self.db = database or get_database()
+        self.max_workers = max_workers or self._default_max_workers()
+        # Serializes database writes from concurrent extraction threads
+        self._db_lock = threading.Lock()
+        # One persistent Blender worker per scanning thread
+        self._worker_local = threading.local()
+        self._workers = []
+        self._workers_lock = threading.Lock()
+        # The worker script is the same for every worker, so it is built,
+        # validated and written to disk once per scan
+        self._worker_script_path = None
+        self._script_lock = threading.Lock()
+        # Pack root paths by pack id, for relative asset paths
+        self._pack_paths = {}
         self.blender_executable = self._find_blender_executable()
         self._load_classification_patterns()
-        logger.info(f"Scanner initialized with Blender: {self.blender_executable}")
+        logger.info(f"Scanner initialized with Blender: {self.blender_executable} "
+                    f"({self.max_workers} workers)")
     
     # ============================================================================
     # Initialization & Configuration
@@ -68,6 +230,17 @@ class RobustAssetScanner:
         # Fallback
         return bpy.app.binary_path
     
+    @staticmethod
+    def _default_max_workers() -> int:
+        """Worker count from AIGEN_SCAN_WORKERS, else half the CPU cores."""
+        env_workers = os.environ.get('AIGEN_SCAN_WORKERS')
+        if env_workers:
+            try:
+                return max(1, int(env_workers))
+            except ValueError:
+                logger.warning(f"Ignoring invalid AIGEN_SCAN_WORKERS value: {env_workers}")
+        return max(1, (os.cpu_count() or 2) // 2)
+
     def _load_classification_patterns(self):
         """Load classification patterns from database."""
         self.category_patterns = {}
@@ -103,10 +276,13 @@ class RobustAssetScanner:
     # ============================================================================
 
     def scan_asset_pack_robust(self, pack_path: str, pack_name: str = None,
-                              force_rescan: bool = False) -> Dict[str, Any]:
+                              force_rescan: bool = False,
+                              max_concurrent: Optional[int] = None) -> Dict[str, Any]:
         """
         Scan an asset pack and extract all visual assets with accurate dimensions.
         Automatically selects optimal extraction strategy based on file size.
+        Blend files are processed concurrently, up to max_concurrent
+        Blender processes (defaults to the scanner's max_workers).
         """
         start_time = time.time()
         logger.info(f"Starting asset pack scan: {pack_path}")
@@ -128,23 +304,175 @@ class RobustAssetScanner:
             return self._create_summary(pack_id, 0, 0, start_time)
         
         logger.info(f"Found {len(blend_files)} blend files")
-        
-        # Process each file
-        processed = 0
-        failed = 0
-        
-        for i, blend_file in enumerate(blend_files):
-            logger.info(f"Processing {i+1}/{len(blend_files)}: {os.path.basename(blend_file)}")
-            
+
+        # Skip files whose size and modification time match the last scan
+        fingerprints = {path: self._file_fingerprint(stat) for path, stat in blend_files}
+        known_fingerprints = {} if force_rescan else self.db.get_file_fingerprints(pack_id)
+        changed_files = [(path, stat) for path, stat in blend_files
+                         if known_fingerprints.get(path) != fingerprints[path]]
+        skipped = len(blend_files) - len(changed_files)
+        if skipped:
+            logger.info(f"Skipping {skipped} unchanged blend files")
+
+        # Changed files (and files scanned before fingerprints existed) are re-extracted
+        if changed_files and not force_rescan:
+            with self._db_lock:
+                self.db.delete_file_assets(pack_id, [path for path, _stat in changed_files])
+
+        # Small files load whole; large files keep per-collection extraction
+        small_files = []
+        large_files = []
+        for blend_file, stat in changed_files:
+            is_large = stat.st_size > self.LARGE_FILE_THRESHOLD
+            (large_files if is_large else small_files).append(blend_file)
+
+        counts = {'processed': 0, 'failed': 0, 'files': {}}
+
+        # Each task just waits on a Blender subprocess, so threads are enough
+        workers = max(1, max_concurrent or self.max_workers)
+        try:
+            self._scan_files(small_files, large_files, pack_id, workers, counts)
+        finally:
+            self.close()
+            # Files that failed, even partly, keep no fingerprint; the next scan
+            # sees them as changed and replaces whatever they stored this time
+            if counts['files']:
+                self.db.record_scanned_files(pack_id, [
+                    (path, fingerprints[path], assets_created)
+                    for path, assets_created in counts['files'].items()
+                ])
+
+        return self._create_summary(pack_id, counts['processed'], counts['failed'], start_time,
+                                    skipped=skipped)
+
+    def _scan_files(self, small_files: List[str], large_files: List[str], pack_id: int,
+                    workers: int, counts: Dict[str, Any]):
+        """
+        Run small and large files on a thread pool, tallying into counts.
+
+        Each file is its own task; a pool thread reuses its persistent Blender
+        worker across the files it picks up. Large files are fed in
+        MAX_CONCURRENT_LARGE_FILES at a time, each one submitted as the
+        previous finishes, so the rest of the pool keeps working through
+        small files instead of blocking on a slot.
+        """
+        pending_large = deque(large_files)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AssetScan") as executor:
+            futures = {}
+
+            def submit_next_large_file():
+                blend_file = pending_large.popleft()
+                futures[executor.submit(self._process_blend_file, blend_file, pack_id)] = (blend_file, True)
+
+            # Large files go first so the longest jobs don't start last
+            for _ in range(min(self.MAX_CONCURRENT_LARGE_FILES, len(pending_large))):
+                submit_next_large_file()
+            for blend_file in small_files:
+                future = executor.submit(self._process_standard_blend_file, blend_file, pack_id)
+                futures[future] = (blend_file, False)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    blend_file, is_large = futures.pop(future)
+                    if is_large and pending_large:
+                        submit_next_large_file()
+                    self._tally_result(future, blend_file, counts)
+
+    def _tally_result(self, future, blend_file: str, counts: Dict[str, Any]):
+        """Log and count the outcome of a finished file."""
+        try:
+            assets_created, rejected, failures = future.result()
+        except Exception as e:
+            counts['failed'] += 1
+            logger.error(f"  ❌ {os.path.basename(blend_file)} failed: {e}")
+            return
+        self._tally_file(blend_file, assets_created, rejected, failures, counts)
+
+    def _tally_file(self, blend_file: str, assets_created: int, rejected: int, failures: int,
+                    counts: Dict[str, Any]):
+        """
+        Count one extracted file. Files with extraction failures aren't
+        fingerprinted, so they are retried next scan; rows the database
+        rejected (e.g. duplicate names) would be rejected again, so those
+        files count as scanned.
+        """
+        name = os.path.basename(blend_file)
+        if failures:
+            counts['failed'] += 1
+            logger.error(f"  ❌ {name}: {failures} extraction failure(s), "
+                         f"kept {assets_created} assets, will be retried next scan")
+            return
+        counts['processed'] += 1
+        counts['files'][blend_file] = assets_created
+        if rejected:
+            logger.warning(f"  ⚠️ {name}: created {assets_created} assets, "
+                           f"{rejected} rejected by the database")
+        else:
+            logger.info(f"  ✅ {name}: created {assets_created} assets")
+
+    # ============================================================================
+    # Blender Workers
+    # ============================================================================
+
+    def _get_worker(self) -> BlenderWorker:
+        """Get (or start) the persistent Blender worker for the current thread."""
+        worker = getattr(self._worker_local, 'worker', None)
+        if worker is None:
+            worker = BlenderWorker(self.blender_executable, self._get_worker_script_path())
+            with self._workers_lock:
+                self._workers.append(worker)
+            self._worker_local.worker = worker
+        return worker
+
+    def _unload_worker_file(self):
+        """Free the blend file held by this thread's worker, restarting it if that fails."""
+        worker = self._get_worker()
+        # A worker killed on timeout or crashed holds nothing; calling it would start a new one
+        if not worker.is_alive():
+            return
+        try:
+            worker.call('unload', timeout=60)
+        except Exception as e:
+            logger.warning(f"Failed to unload Blender worker file, restarting worker: {e}")
+            worker.kill()
+
+    def _get_worker_script_path(self) -> str:
+        """Return the path of the generated worker script, creating it on first use."""
+        with self._script_lock:
+            if self._worker_script_path is None:
+                script_content = self._create_worker_script()
+                self._validate_script_generation(script_content, 'worker')
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False,
+                                                 encoding='utf-8') as script_file:
+                    script_file.write(script_content)
+                    self._worker_script_path = script_file.name
+            return self._worker_script_path
+
+    def close(self):
+        """Shut down all Blender workers and remove the worker script."""
+        with self._workers_lock:
+            workers, self._workers = self._workers, []
+        with self._script_lock:
+            script_path, self._worker_script_path = self._worker_script_path, None
+        # Thread-local references are dropped with the threads; a fresh
+        # scan starts new workers
+        self._worker_local = threading.local()
+
+        for worker in workers:
             try:
-                assets_created = self._process_blend_file(blend_file, pack_id)
-                processed += 1
-                logger.info(f"  ✅ Created {assets_created} assets")
+                worker.close()
             except Exception as e:
-                failed += 1
-                logger.error(f"  ❌ Failed: {e}")
-        
-        return self._create_summary(pack_id, processed, failed, start_time)
+                logger.debug(f"Failed to stop Blender worker: {e}")
+
+        if script_path:
+            try:
+                os.unlink(script_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Failed to cleanup temp file {script_path}: {e}")
     
     # ============================================================================
     # Pack & File Management
@@ -176,43 +504,66 @@ class RobustAssetScanner:
         """Clear existing assets for force rescan."""
         try:
             with self.db.get_connection() as conn:
-                conn.execute("DELETE FROM asset_tags WHERE asset_id IN (SELECT id FROM assets WHERE pack_id = ?)", (pack_id,))
-                conn.execute("DELETE FROM asset_properties WHERE asset_id IN (SELECT id FROM assets WHERE pack_id = ?)", (pack_id,))
+                # Tags, properties and other per-asset rows go with ON DELETE CASCADE
                 conn.execute("DELETE FROM assets WHERE pack_id = ?", (pack_id,))
                 conn.execute("DELETE FROM scan_queue WHERE pack_id = ?", (pack_id,))
+                conn.execute("DELETE FROM scanned_files WHERE pack_id = ?", (pack_id,))
                 conn.commit()
                 logger.info("Cleared existing pack assets")
         except Exception as e:
             logger.error(f"Failed to clear pack assets: {e}")
     
-    def _find_blend_files(self, pack_path: str) -> List[str]:
-        """Find all valid .blend files in the pack directory."""
-        blend_files = []
-        
-        for root, dirs, files in os.walk(pack_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and 
-                      d.lower() not in ['backup', 'temp', 'cache', '__pycache__']]
-            
-            for file in files:
-                if file.lower().endswith('.blend') and not file.startswith('.'):
-                    full_path = os.path.join(root, file)
-                    try:
-                        if os.path.getsize(full_path) > 1024:  # At least 1KB
-                            blend_files.append(full_path)
-                    except OSError:
-                        logger.warning(f"Skipping unreadable file: {file}")
-        
-        return sorted(blend_files)
-    
+    def _find_blend_files(self, pack_path: str) -> List[Tuple[str, os.stat_result]]:
+        """Find all valid .blend files in the pack directory as (path, stat) pairs."""
+        return sorted(self._walk_blend_files(pack_path), key=lambda item: item[0])
+
+    @staticmethod
+    def _file_fingerprint(stat: os.stat_result) -> str:
+        """Cheap change marker for a blend file: size plus modification time."""
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _walk_blend_files(self, directory: str):
+        """
+        Yield (path, stat) for .blend files under directory.
+
+        Uses os.scandir so the size comes from the directory entry instead of
+        a separate stat call per file.
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory: {directory} ({e})")
+            return
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name.lower() not in self.SKIPPED_DIRECTORIES:
+                            yield from self._walk_blend_files(entry.path)
+                    elif name.lower().endswith('.blend') and entry.is_file():
+                        stat = entry.stat()
+                        if stat.st_size > 1024:  # At least 1KB
+                            yield entry.path, stat
+                except OSError:
+                    logger.warning(f"Skipping unreadable file: {name}")
+
     # ============================================================================
     # Blend File Processing
     # ============================================================================
 
-    def _process_blend_file(self, blend_file_path: str, pack_id: int) -> int:
+    def _process_blend_file(self, blend_file_path: str, pack_id: int) -> Tuple[int, int, int]:
         """
         Process a single blend file with automatic strategy selection.
         Large files (>500MB) use per-collection extraction for memory efficiency.
+
+        Returns:
+            (assets created, rows rejected, failures): rows rejected counts
+            assets the database refused (e.g. duplicate names); failures counts
+            collections or standalone passes that couldn't be extracted.
         """
         # Check file size and select strategy
         file_size = os.path.getsize(blend_file_path)
@@ -221,139 +572,43 @@ class RobustAssetScanner:
 
         if file_size > self.LARGE_FILE_THRESHOLD:
             logger.info("🚀 Using per-collection extraction (memory-efficient for large files)")
-            return self._process_large_blend_file(blend_file_path, pack_id)
+            try:
+                return self._process_large_blend_file(blend_file_path, pack_id)
+            finally:
+                # The worker would otherwise keep the file loaded while the
+                # next large file opens on another thread's worker
+                self._unload_worker_file()
         else:
             logger.info("⚡ Using standard extraction (fast for small files)")
             return self._process_standard_blend_file(blend_file_path, pack_id)
 
-    def _process_standard_blend_file(self, blend_file_path: str, pack_id: int) -> int:
-        """Process a small/medium blend file using standard extraction (loads entire file)."""
-        # Use unified script generator
-        script_content = self._create_extraction_script(
-            mode='full_file',
-            blend_file_path=blend_file_path
-        )
-
-        # Validate script before execution
-        self._validate_script_generation(script_content, 'full_file')
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as script_file:
-            script_file.write(script_content)
-            script_path = script_file.name
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = output_file.name
+    def _process_standard_blend_file(self, blend_file_path: str, pack_id: int) -> Tuple[int, int, int]:
+        """
+        Process a small/medium blend file using standard extraction (loads entire file).
+        Returns (assets created, rows rejected, failures) like _process_blend_file.
+        """
+        extraction_data = self._get_worker().call('extract_full', path=blend_file_path, timeout=120)
 
-        try:
-            # Run Blender subprocess with explicit file path argument
-            cmd = [
-                self.blender_executable,
-                "--background",
-                "--python", script_path,
-                "--", blend_file_path, output_path
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                cwd=os.path.dirname(blend_file_path)
-            )
+        if 'error' in extraction_data:
+            raise Exception(f"Extraction failed: {extraction_data['error']}")
 
-            if result.returncode != 0:
-                error_details = f"Blender subprocess failed (code {result.returncode})"
-                if result.stderr:
-                    error_details += f"\nSTDERR: {result.stderr[-1000:]}"
-                if result.stdout:
-                    error_details += f"\nSTDOUT (last 500): {result.stdout[-500:]}"
-                raise Exception(error_details)
-            
-            # Read and process results
-            if not os.path.exists(output_path):
-                raise Exception("No output data generated")
-            
-            with open(output_path, 'r') as f:
-                extraction_data = json.load(f)
-            
-            if 'error' in extraction_data:
-                raise Exception(f"Extraction failed: {extraction_data['error']}")
-            
-            return self._store_extracted_data(extraction_data, pack_id, blend_file_path)
-                
-        finally:
-            # Clean up temp files
-            for temp_path in [script_path, output_path]:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except Exception as e:
-                    logger.debug(f"Failed to cleanup temp file {temp_path}: {e}")
+        assets_created, rejected = self._store_extracted_data(extraction_data, pack_id, blend_file_path)
+        return assets_created, rejected, 0
 
     def _quick_scan_collections(self, blend_file_path: str) -> List[str]:
         """
-        Quickly scan blend file to get list of collection names without loading geometry.
-        Uses metadata-only access for speed (~5-10 seconds for large files).
+        Quickly scan blend file to get list of parent collection names.
+        Files with no candidate collection names are answered from the file's
+        ID directory without being opened (~5-10 seconds saved for large files).
         """
-        # Use unified script generator
-        script_content = self._create_extraction_script(
-            mode='quick_scan',
-            blend_file_path=blend_file_path
-        )
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as script_file:
-            script_file.write(script_content)
-            script_path = script_file.name
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = output_file.name
+        scan_data = self._get_worker().call('quick_scan', path=blend_file_path, timeout=60)
 
-        try:
-            # Run quick scan subprocess with explicit file path argument
-            cmd = [
-                self.blender_executable,
-                "--background",
-                "--python", script_path,
-                "--", blend_file_path, output_path
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,  # Quick scan should be fast
-                cwd=os.path.dirname(blend_file_path)
-            )
-
-            if result.returncode != 0:
-                error_details = f"Quick scan failed (code {result.returncode})"
-                if result.stderr:
-                    error_details += f"\nSTDERR: {result.stderr[-1000:]}"
-                if result.stdout:
-                    error_details += f"\nSTDOUT (last 500): {result.stdout[-500:]}"
-                raise Exception(error_details)
+        if not scan_data.get('success'):
+            raise Exception(f"Quick scan error: {scan_data.get('error')}")
 
-            # Read results
-            with open(output_path, 'r') as f:
-                scan_data = json.load(f)
-
-            if not scan_data.get('success'):
-                raise Exception(f"Quick scan error: {scan_data.get('error')}")
-
-            collection_names = [c['name'] for c in scan_data['collections']]
-            logger.info(f"Quick scan found {len(collection_names)} collections")
-            return collection_names
-
-        finally:
-            # Clean up temp files
-            for temp_path in [script_path, output_path]:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except Exception as e:
-                    logger.debug(f"Failed to cleanup temp file {temp_path}: {e}")
+        collection_names = [c['name'] for c in scan_data['collections']]
+        logger.info(f"Quick scan found {len(collection_names)} collections")
+        return collection_names
 
     # ============================================================================
     # Script Generation (Blender Subprocess Scripts)
@@ -372,10 +627,11 @@ class RobustAssetScanner:
 
         # 2. Required function validation
         required_functions = {
-            'single_collection': ['main', 'get_all_collection_objects'],
-            'full_file': ['main', 'get_all_collection_objects'],
-            'standalone': ['main', 'get_all_collection_objects'],
-            'quick_scan': ['main', 'has_visual_objects_recursive']
+            'worker': ['dispatch', 'get_all_collection_objects', 'collect_standalone_objects', 'unload_file'],
+            'quick_scan': ['main', 'has_visual_objects_recursive'],
+            'extract_full': ['main'],
+            'extract_collection': ['main'],
+            'extract_standalone': ['main'],
         }
 
         if mode in required_functions:
@@ -383,39 +639,35 @@ class RobustAssetScanner:
                 if f'def {func}(' not in script:
                     raise ValueError(f"Generated {mode} script missing required function: {func}")
 
-        # 3. Argument parsing validation
-        if 'output_path' not in script:
-            raise ValueError(f"Generated {mode} script missing output_path handling")
-
     def _get_common_extraction_functions(self) -> str:
         """Get the common helper functions used by all extraction scripts."""
         return """
 # IMPORTANT: Functions are ordered by dependencies - base functions first!
 
-def get_polygon_count(obj):
-    \"\"\"Safely get polygon count from object.\"\"\"
-    try:
-        if obj and obj.type == 'MESH' and obj.data and hasattr(obj.data, 'polygons'):
-            return len(obj.data.polygons)
-    except:
-        pass
-    return 0
+# Blender bundles numpy; the pure-Python paths below are kept as a fallback
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def get_vertex_count(obj):
-    \"\"\"Safely get vertex count from object.\"\"\"
+def get_mesh_counts(obj):
+    \"\"\"Safely get (polygon_count, vertex_count) from object, reading obj.data once.\"\"\"
     try:
-        if obj and obj.type == 'MESH' and obj.data and hasattr(obj.data, 'vertices'):
-            return len(obj.data.vertices)
+        if obj and obj.type == 'MESH':
+            mesh = obj.data
+            if mesh:
+                return len(mesh.polygons), len(mesh.vertices)
     except:
         pass
-    return 0
+    return 0, 0
 
 def is_visual_object(obj):
     \"\"\"Check if object is a visual mesh with geometry.\"\"\"
-    if not obj or obj.type != 'MESH' or not obj.data:
+    if not obj or obj.type != 'MESH':
         return False
 
-    if get_polygon_count(obj) == 0:
+    mesh = obj.data
+    if not mesh or len(mesh.polygons) == 0:
         return False
 
     try:
@@ -427,6 +679,18 @@ def is_visual_object(obj):
 
     return True
 
+def has_axis_aligned_transform(matrix):
+    \"\"\"Check that each world axis depends on at most one local axis.\"\"\"
+    for row in range(3):
+        if sum(1 for col in range(3) if abs(matrix[row][col]) > 1e-6) > 1:
+            return False
+    return True
+
+def has_exact_corner_bounds(obj):
+    \"\"\"Check if the object's transformed bound_box corners give its exact world bounds.\"\"\"
+    return (bool(getattr(obj, 'bound_box', None)) and hasattr(obj, 'matrix_world')
+            and has_axis_aligned_transform(obj.matrix_world))
+
 def calculate_object_bounds(obj):
     \"\"\"Calculate accurate world-space bounding box for an object.\"\"\"
     if not obj or not obj.data or obj.type != 'MESH':
@@ -437,101 +701,184 @@ def calculate_object_bounds(obj):
         return [0, 0, 0], [0, 0, 0], [0, 0, 0]
 
     try:
+        # Blender keeps the local bounding box; for transforms that only scale,
+        # flip or swap axes its 8 transformed corners give the exact bounds
+        if has_exact_corner_bounds(obj):
+            corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
+            bbox_min = [min(c[i] for c in corners) for i in range(3)]
+            bbox_max = [max(c[i] for c in corners) for i in range(3)]
+            dimensions = [bbox_max[i] - bbox_min[i] for i in range(3)]
+            if max(dimensions) > 0.0001:
+                return bbox_min, bbox_max, dimensions
+
+        # Rotated objects and empty bound boxes need the full vertex scan
         if hasattr(obj, 'matrix_world') and mesh.vertices:
-            world_vertices = []
-            for vertex in mesh.vertices:
-                world_pos = obj.matrix_world @ vertex.co
-                world_vertices.append([world_pos.x, world_pos.y, world_pos.z])
-
-            if world_vertices:
+            if np is not None:
+                # Read all coordinates in one call and transform them as a block
+                vertex_count = len(mesh.vertices)
+                co = np.empty(vertex_count * 3, dtype=np.float32)
+                mesh.vertices.foreach_get('co', co)
+                co = co.reshape(vertex_count, 3)
+                matrix = np.array(obj.matrix_world, dtype=np.float64)
+                world = co @ matrix[:3, :3].T + matrix[:3, 3]
+                bbox_min = world.min(axis=0).tolist()
+                bbox_max = world.max(axis=0).tolist()
+            else:
+                world_vertices = []
+                for vertex in mesh.vertices:
+                    world_pos = obj.matrix_world @ vertex.co
+                    world_vertices.append([world_pos.x, world_pos.y, world_pos.z])
                 bbox_min = [min(v[i] for v in world_vertices) for i in range(3)]
                 bbox_max = [max(v[i] for v in world_vertices) for i in range(3)]
-                dimensions = [bbox_max[i] - bbox_min[i] for i in range(3)]
 
-                if max(dimensions) > 0.0001:
-                    return bbox_min, bbox_max, dimensions
+            dimensions = [bbox_max[i] - bbox_min[i] for i in range(3)]
+            if max(dimensions) > 0.0001:
+                return bbox_min, bbox_max, dimensions
     except Exception as e:
         print(f"Bounds calculation failed for {{obj.name}}: {{e}}")
 
     return [0, 0, 0], [0, 0, 0], [0, 0, 0]
 
-def get_all_collection_objects(collection):
-    \"\"\"Recursively get all objects including from child collections.\"\"\"
-    objects = [obj for obj in collection.objects if is_visual_object(obj)]
-
-    # Add objects from child collections recursively
-    for child_coll in collection.children:
-        objects.extend(get_all_collection_objects(child_coll))
-
-    return objects
-
-def calculate_collection_bounds(visual_objects):
-    \"\"\"Calculate accurate bounding box for a collection of objects.\"\"\"
-    if not visual_objects:
-        return [0, 0, 0], [0, 0, 0], [0, 0, 0]
-
+def get_visual_object_names():
+    \"\"\"Names of every visual object in the file, checked once per object.\"\"\"
+    return {obj.name_full for obj in bpy.data.objects if is_visual_object(obj)}
+
+def get_collection_user_counts():
+    \"\"\"
+    Count the collections each object is linked into, keyed by name_full.
+
+    Matches len(obj.users_collection), which searches every collection and
+    scene on each access, with one pass over the collections.
+    \"\"\"
+    counts = {}
+    linked_collections = list(bpy.data.collections)
+    linked_collections.extend(scene.collection for scene in bpy.data.scenes)
+    for collection in linked_collections:
+        for obj in collection.objects:
+            key = obj.name_full
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+def get_all_collection_objects(collection, visual_names=None):
+    \"\"\"
+    Get all visual objects in a collection and its child collections.
+    collection.all_objects is flattened by Blender itself, so nested collections
+    need no Python recursion and objects linked at several levels appear once.
+    Pass the set from get_visual_object_names() to skip re-checking each object.
+    \"\"\"
+    if visual_names is not None:
+        return [obj for obj in collection.all_objects if obj.name_full in visual_names]
+    return [obj for obj in collection.all_objects if is_visual_object(obj)]
+
+def summarize_objects(visual_objects):
+    \"\"\"
+    Total polygons, total vertices and accurate bounding box for a collection of
+    objects, gathered in a single pass.
+    \"\"\"
+    total_polygons = 0
+    total_vertices = 0
     bbox_min = [float('inf')] * 3
     bbox_max = [float('-inf')] * 3
     valid_bounds_found = False
 
+    def merge(obj_bbox_min, obj_bbox_max):
+        for i in range(3):
+            bbox_min[i] = min(bbox_min[i], obj_bbox_min[i])
+            bbox_max[i] = max(bbox_max[i], obj_bbox_max[i])
+
+    # Objects bounded exactly by their bound_box are transformed together below
+    corner_objects = []
+    scan_objects = []
     for obj in visual_objects:
-        obj_bbox_min, obj_bbox_max, obj_dimensions = calculate_object_bounds(obj)
+        polygon_count, vertex_count = get_mesh_counts(obj)
+        total_polygons += polygon_count
+        total_vertices += vertex_count
+        if np is not None and has_exact_corner_bounds(obj):
+            corner_objects.append(obj)
+        else:
+            scan_objects.append(obj)
 
+    if corner_objects:
+        try:
+            corners = np.array([obj.bound_box for obj in corner_objects], dtype=np.float64)
+            matrices = np.array([obj.matrix_world for obj in corner_objects], dtype=np.float64)
+            world = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+            obj_mins = world.min(axis=1)
+            obj_maxs = world.max(axis=1)
+            obj_sizes = (obj_maxs - obj_mins).max(axis=1)
+
+            # Degenerate boxes fall back to the vertex scan, as in calculate_object_bounds
+            scan_objects.extend(obj for obj, size in zip(corner_objects, obj_sizes) if size <= 0.0001)
+            valid = obj_sizes > 0.001
+            if valid.any():
+                valid_bounds_found = True
+                merge(obj_mins[valid].min(axis=0).tolist(), obj_maxs[valid].max(axis=0).tolist())
+        except Exception as e:
+            print(f"Batched bounds calculation failed: {e}")
+            scan_objects.extend(corner_objects)
+
+    for obj in scan_objects:
+        obj_bbox_min, obj_bbox_max, obj_dimensions = calculate_object_bounds(obj)
         if max(obj_dimensions) > 0.001:
             valid_bounds_found = True
-            for i in range(3):
-                bbox_min[i] = min(bbox_min[i], obj_bbox_min[i])
-                bbox_max[i] = max(bbox_max[i], obj_bbox_max[i])
+            merge(obj_bbox_min, obj_bbox_max)
 
     if not valid_bounds_found:
-        return [0, 0, 0], [0, 0, 0], [0, 0, 0]
+        return total_polygons, total_vertices, [0, 0, 0], [0, 0, 0], [0, 0, 0]
 
     dimensions = [bbox_max[i] - bbox_min[i] for i in range(3)]
-    return bbox_min, bbox_max, dimensions
+    return total_polygons, total_vertices, bbox_min, bbox_max, dimensions
+
+SKIP_OBJECT_PREFIXES = ('cs_', 'ctrl', 'ik_', 'bone', 'meta', 'wgt_')
+SKIP_OBJECT_KEYWORDS = ('control', 'constraint', 'driver', 'target', 'pole', 'helper', 'locator')
 
 def should_skip_object_name(name):
     \"\"\"Skip rig controls and system objects by name.\"\"\"
     if not name:
         return True
     name_lower = name.lower()
-    skip_prefixes = ['cs_', 'ctrl', 'ik_', 'bone', 'meta', 'wgt_']
-    if any(name_lower.startswith(prefix) for prefix in skip_prefixes):
+    # str.startswith checks the whole tuple in one call
+    if name_lower.startswith(SKIP_OBJECT_PREFIXES):
         return True
-    skip_keywords = ['control', 'constraint', 'driver', 'target', 'pole', 'helper', 'locator']
-    return any(keyword in name_lower for keyword in skip_keywords)
+    return any(keyword in name_lower for keyword in SKIP_OBJECT_KEYWORDS)
 
-def is_parent_collection(collection):
-    \"\"\"Check if collection is a top-level parent (not nested inside another collection).\"\"\"
+def get_child_collection_names():
+    \"\"\"Names of every collection nested inside another; anything else is a top-level parent.\"\"\"
     import bpy
-    # A collection is a parent if it's not a child of any other collection
+    child_names = set()
     for potential_parent in bpy.data.collections:
-        if potential_parent == collection:
+        child_names.update(child.name for child in potential_parent.children)
+    return child_names
+
+def compile_patterns(patterns):
+    \"\"\"
+    Compile each pattern's keywords into one regex, ordered by confidence.
+
+    classify_name() takes the first matching entry, which is the same pattern
+    the per-keyword scan picked: highest confidence, earliest on ties.
+    \"\"\"
+    import re
+    matchers = []
+    for pattern_name, pattern_data in patterns.items():
+        keywords = pattern_data.get('keywords', [])
+        confidence = pattern_data.get('confidence', 0.5)
+        if not keywords or confidence <= 0:
             continue
-        # Check if this collection is in the parent's children
-        if collection.name in [child.name for child in potential_parent.children]:
-            return False  # This collection is a child
-    return True  # This collection is a top-level parent
+        regex = re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+        matchers.append((confidence, pattern_name, regex))
+    matchers.sort(key=lambda matcher: -matcher[0])
+    return [(pattern_name, regex) for _confidence, pattern_name, regex in matchers]
 
-def classify_name(name, patterns):
-    \"\"\"Classify name using patterns.\"\"\"
+def classify_name(name, matchers):
+    \"\"\"Classify name using patterns compiled by compile_patterns().\"\"\"
     if not name:
         return None
 
     name_lower = name.lower()
-    best_match = None
-    best_confidence = 0.0
-
-    for pattern_name, pattern_data in patterns.items():
-        keywords = pattern_data.get('keywords', [])
-        confidence = pattern_data.get('confidence', 0.5)
-
-        for keyword in keywords:
-            if keyword.lower() in name_lower:
-                if confidence > best_confidence:
-                    best_match = pattern_name
-                    best_confidence = confidence
-                break
-    return best_match
+    for pattern_name, regex in matchers:
+        if regex.search(name_lower):
+            return pattern_name
+    return None
 
 def calculate_complexity(polygon_count, object_count=1):
     \"\"\"Calculate 0-10 complexity score.\"\"\"
@@ -550,33 +897,76 @@ def determine_quality(polygon_count):
     elif polygon_count < 2000: return 'medium'
     elif polygon_count < 10000: return 'high'
     else: return 'ultra'
-"""
 
-    def _create_extraction_script(self,
-                                  mode: str,
-                                  blend_file_path: str,
-                                  collection_name: Optional[str] = None,
-                                  excluded_collections: Optional[List[str]] = None) -> str:
-        """
-        Unified script generator for all extraction modes.
+def collect_standalone_objects(claimed_names, visual_names):
+    \"\"\"
+    Build asset records for visual objects that belong to no collection asset.
 
-        Args:
-            mode: 'single_collection', 'full_file', 'standalone', or 'quick_scan'
-            blend_file_path: Path to the blend file (passed as explicit argument)
-            collection_name: Name of collection (for single_collection mode)
-            excluded_collections: Collections to exclude (for standalone mode)
+    Objects named in claimed_names, linked into several collections, or named
+    like rig helpers are left out.
+    \"\"\"
+    records = []
+    user_counts = get_collection_user_counts()
+    for obj in bpy.data.objects:
+        if obj.name in claimed_names:
+            continue
 
-        Returns:
-            Complete Python script as string
-        """
-        # Generate mode-specific configuration
-        mode_config = self._get_mode_config(mode, collection_name, excluded_collections)
+        if obj.name_full not in visual_names or user_counts.get(obj.name_full, 0) > 1:
+            continue
+
+        if should_skip_object_name(obj.name):
+            continue
+
+        polygon_count, vertex_count = get_mesh_counts(obj)
+        bbox_min, bbox_max, dimensions = calculate_object_bounds(obj)
+
+        if polygon_count > 0 and max(dimensions) > 0.001:  # At least 1mm
+            category = classify_name(obj.name, CATEGORY_MATCHERS) or 'props'
+
+            records.append({
+                'name': obj.name,
+                'type': 'object',
+                'polygon_count': polygon_count,
+                'vertex_count': vertex_count,
+                'dimensions': dimensions,
+                'bbox_min': bbox_min,
+                'bbox_max': bbox_max,
+                'category': category,
+                'complexity_score': calculate_complexity(polygon_count, 1),
+                'quality_tier': determine_quality(polygon_count),
+                'has_geometry': True
+            })
+            print(f"✅ STANDALONE: Object {obj.name} - {polygon_count} polys, dims: {[round(d, 3) for d in dimensions]}")
+        else:
+            print(f"⚠️  SKIPPED: Object {obj.name} - {polygon_count} polys, dims: {[round(d, 3) for d in dimensions]}")
+    return records
 
-        # Generate mode-specific main function
-        main_function = self._get_mode_main_function(mode)
+CATEGORY_MATCHERS = compile_patterns(CATEGORY_PATTERNS)
+"""
 
-        # Build complete script
-        script = f"""
+    def _create_worker_script(self) -> str:
+        """
+        Build the driver script for BlenderWorker: loads every mode's main()
+        into its own namespace once, then serves JSON-line requests from stdin
+        until it receives a shutdown request.
+        """
+        # Each mode defines its own main() (and helpers such as
+        # should_skip_collection), so they are kept apart as source strings
+        mode_sources = {
+            'quick_scan': self._get_quick_scan_main(),
+            'extract_full': self._get_full_file_main(),
+            'extract_collection': self._get_single_collection_main(),
+            'extract_standalone': self._get_standalone_main(),
+        }
+        # The sources are embedded as strings, so check them here rather than
+        # when the worker starts
+        for op, source in mode_sources.items():
+            self._validate_script_generation(source, op)
+        mode_sources_literal = "{\n" + "".join(
+            f"    {op!r}: {source!r},\n" for op, source in mode_sources.items()
+        ) + "}"
+
+        return f"""
 import bpy
 import json
 import sys
@@ -584,91 +974,137 @@ import os
 import mathutils
 from mathutils import Vector
 
-# Parse command-line arguments explicitly
-# Expected: blender --background --python script.py -- blend_file output_path
-if '--' in sys.argv:
-    args_start = sys.argv.index('--') + 1
-    args = sys.argv[args_start:]
-    blend_file_path = args[0] if len(args) > 0 else None
-    output_path = args[1] if len(args) > 1 else "output.json"
-else:
-    # Fallback for old-style invocation
-    blend_file_path = bpy.data.filepath
-    output_path = sys.argv[-1] if len(sys.argv) > 6 else "output.json"
+{self._get_json_helpers()}
+
+RESPONSE_PREFIX = {BlenderWorker.RESPONSE_PREFIX!r}
 
-{mode_config}
+{self._get_mode_config()}
 
 {self._get_common_extraction_functions()}
 
-{main_function}
+MODE_SOURCES = {mode_sources_literal}
+
+HANDLERS = {{}}
+for _op, _source in MODE_SOURCES.items():
+    _namespace = dict(globals())
+    exec(compile(_source, f"<{{_op}}>", "exec"), _namespace)
+    HANDLERS[_op] = _namespace
+
+def unload_file():
+    \"\"\"Replace the open blend file with an empty one so its data is freed.\"\"\"
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    return {{"success": True}}
+
+def dispatch(request):
+    if request['op'] == 'unload':
+        return unload_file()
+    namespace = HANDLERS[request['op']]
+    blend_file_path = request.get('path')
+    namespace['blend_file_path'] = blend_file_path
+    namespace['TARGET_COLLECTION'] = request.get('collection')
+    namespace['EXCLUDED_COLLECTIONS'] = request.get('excluded', [])
+
+    # Each main() opens the blend file itself, and only if it needs to
+    return namespace['main']()
+
+def respond(payload):
+    sys.stdout.write(RESPONSE_PREFIX + json_dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+respond({{"success": True, "ready": True}})
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    line = line.strip()
+    if not line:
+        continue
+
+    request = json.loads(line)
+    if request.get('op') == 'shutdown':
+        break
+
+    try:
+        result = dispatch(request)
+    except Exception as e:
+        import traceback
+        result = {{"error": str(e), "traceback": traceback.format_exc(), "success": False}}
+        print(f"WORKER {{request.get('op', '').upper()}} ERROR: {{e}}")
+    respond(result)
+"""
 
-# Main execution
+    def _get_json_helpers(self) -> str:
+        """Result serializer for generated scripts: orjson if Blender's Python has it."""
+        return """
 try:
-    result = main()
-    with open(output_path, 'w') as f:
-        json.dump(result, f, indent=2)
-except Exception as e:
-    import traceback
-    error_data = {{"error": str(e), "traceback": traceback.format_exc(), "success": False}}
-    with open(output_path, 'w') as f:
-        json.dump(error_data, f)
-    print(f"{{'{mode.upper()}'}} EXTRACTION ERROR: {{e}}")
-    raise
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    json_dumps = json.dumps
 """
-        return script
-
-    def _get_mode_config(self, mode: str, collection_name: Optional[str],
-                        excluded_collections: Optional[List[str]]) -> str:
-        """Generate mode-specific configuration variables."""
-        config = f"CATEGORY_PATTERNS = {json.dumps(self.category_patterns)}\n"
-
-        if mode == 'single_collection' and collection_name:
-            config += f'TARGET_COLLECTION = "{collection_name}"\n'
-        elif mode == 'standalone' and excluded_collections:
-            config += f'EXCLUDED_COLLECTIONS = {json.dumps(excluded_collections)}\n'
-
-        return config
-
-    def _get_mode_main_function(self, mode: str) -> str:
-        """Generate mode-specific main function."""
-        if mode == 'quick_scan':
-            return self._get_quick_scan_main()
-        elif mode == 'single_collection':
-            return self._get_single_collection_main()
-        elif mode == 'full_file':
-            return self._get_full_file_main()
-        elif mode == 'standalone':
-            return self._get_standalone_main()
-        else:
-            raise ValueError(f"Unknown extraction mode: {mode}")
+
+    def _get_mode_config(self) -> str:
+        """Generate configuration variables shared by every mode."""
+        return f"CATEGORY_PATTERNS = {json.dumps(self.category_patterns)}\n"
 
     def _get_quick_scan_main(self) -> str:
         """Generate main function for quick_scan mode."""
         return """
-def has_visual_objects_recursive(collection):
+def has_visual_objects_recursive(collection, cache):
     '''Recursively check if collection or any child has mesh objects.'''
-    # Check direct objects
-    for obj in collection.objects:
-        if obj.type == 'MESH':
-            return True
-    # Check child collections recursively
-    for child_coll in collection.children:
-        if has_visual_objects_recursive(child_coll):
-            return True
-    return False
+    # Sub-collections can be linked under several parents; visit each once
+    key = collection.name_full
+    if key in cache:
+        return cache[key]
+
+    # Check direct objects, then child collections recursively
+    found = (any(obj.type == 'MESH' for obj in collection.objects)
+             or any(has_visual_objects_recursive(child_coll, cache)
+                    for child_coll in collection.children))
+    cache[key] = found
+    return found
+
+def should_skip_collection_name(name):
+    '''Skip default and system collections by name.'''
+    name_lower = name.lower()
+    if name_lower in ['collection', 'scene collection']:
+        return True
+    skip_keywords = ['rig', 'control', 'bone', 'constraint', 'driver', 'meta']
+    return any(keyword in name_lower for keyword in skip_keywords)
 
 def should_skip_collection(collection):
     '''Skip empty or system collections.'''
     if not collection:
         return True
-    name_lower = collection.name.lower()
-    if name_lower in ['collection', 'scene collection']:
-        return True
-    skip_keywords = ['rig', 'control', 'bone', 'constraint', 'driver', 'meta']
-    return any(keyword in name_lower for keyword in skip_keywords)
+    return should_skip_collection_name(collection.name)
+
+def empty_result():
+    '''Quick-scan result for a file with no usable collections.'''
+    return {
+        'success': True,
+        'collections': [],
+        'total_collections': 0,
+        'child_collections_skipped': 0
+    }
 
 def main():
+    if blend_file_path and os.path.exists(blend_file_path) and bpy.data.filepath != blend_file_path:
+        # Read only the file's ID names first; files without any usable
+        # collection never get fully loaded
+        with bpy.data.libraries.load(blend_file_path, link=False) as (data_from, data_to):
+            collection_names = list(data_from.collections)
+        if not any(not should_skip_collection_name(name) for name in collection_names):
+            print("Found 0 parent collections (no candidate collection names)")
+            return empty_result()
+
+        bpy.ops.wm.open_mainfile(filepath=blend_file_path)
+
     collections = []
+    child_names = get_child_collection_names()
+    visual_cache = {}
     child_collections_skipped = 0
 
     for collection in bpy.data.collections:
@@ -676,12 +1112,12 @@ def main():
             continue
 
         # Skip child collections - only process parents
-        if not is_parent_collection(collection):
+        if collection.name in child_names:
             child_collections_skipped += 1
             continue
 
         # Check if it has visual objects (including in child collections)
-        if has_visual_objects_recursive(collection):
+        if has_visual_objects_recursive(collection, visual_cache):
             collections.append({
                 'name': collection.name,
                 'object_count': len(collection.objects)
@@ -719,11 +1155,7 @@ def main():
     }
 
     # Find the target collection
-    target_coll = None
-    for collection in bpy.data.collections:
-        if collection.name == TARGET_COLLECTION:
-            target_coll = collection
-            break
+    target_coll = bpy.data.collections.get(TARGET_COLLECTION)
 
     if not target_coll:
         print(f"❌ Collection '{TARGET_COLLECTION}' not found")
@@ -760,9 +1192,7 @@ def main():
 
     # Calculate collection stats (aggregated from parent and all children)
     try:
-        total_polygons = sum(get_polygon_count(obj) for obj in visual_objects)
-        total_vertices = sum(get_vertex_count(obj) for obj in visual_objects)
-        bbox_min, bbox_max, dimensions = calculate_collection_bounds(visual_objects)
+        total_polygons, total_vertices, bbox_min, bbox_max, dimensions = summarize_objects(visual_objects)
     except Exception as e:
         import traceback
         error_msg = f"Failed to calculate collection stats: {str(e)}"
@@ -786,7 +1216,7 @@ def main():
         print(f"   Including {len(visual_objects)} objects from {child_count} child collections")
 
     if total_polygons > 0 and max(dimensions) > 0.001:
-        category = classify_name(target_coll.name, CATEGORY_PATTERNS) or 'props'
+        category = classify_name(target_coll.name, CATEGORY_MATCHERS) or 'props'
 
         data['file_info']['collections'].append({
             'name': target_coll.name,
@@ -842,31 +1272,29 @@ def main():
     objects_in_collections = set()
 
     # Process collections (parent collections only)
+    child_names = get_child_collection_names()
+    visual_names = get_visual_object_names()
     child_collections_skipped = 0
     for collection in bpy.data.collections:
         if should_skip_collection(collection):
             continue
 
         # Skip child collections - only process parents
-        if not is_parent_collection(collection):
+        if collection.name in child_names:
             child_collections_skipped += 1
             continue
 
         # Get visual objects from this collection AND all child collections (recursive)
-        visual_objects = get_all_collection_objects(collection)
+        visual_objects = get_all_collection_objects(collection, visual_names)
         if not visual_objects:
             continue
 
-        # Calculate collection stats
-        total_polygons = sum(get_polygon_count(obj) for obj in visual_objects)
-        total_vertices = sum(get_vertex_count(obj) for obj in visual_objects)
-
-        # Calculate proper bounding box for collection
-        bbox_min, bbox_max, dimensions = calculate_collection_bounds(visual_objects)
+        # Calculate collection stats and proper bounding box in one pass
+        total_polygons, total_vertices, bbox_min, bbox_max, dimensions = summarize_objects(visual_objects)
 
         # Only include collections with actual size and geometry
         if total_polygons > 0 and max(dimensions) > 0.001:  # At least 1mm
-            category = classify_name(collection.name, CATEGORY_PATTERNS) or 'props'
+            category = classify_name(collection.name, CATEGORY_MATCHERS) or 'props'
 
             data['file_info']['collections'].append({
                 'name': collection.name,
@@ -892,42 +1320,7 @@ def main():
             print(f"⚠️  SKIPPED: Collection {collection.name} - {total_polygons} polys, dims: {[round(d, 3) for d in dimensions]}")
 
     # Process standalone objects
-    for obj in bpy.data.objects:
-        # Skip objects that are already part of a collection asset
-        if obj.name in objects_in_collections:
-            continue
-
-        if not is_visual_object(obj) or len(obj.users_collection) > 1:
-            continue
-
-        if should_skip_object_name(obj.name):
-            continue
-
-        polygon_count = get_polygon_count(obj)
-        vertex_count = get_vertex_count(obj)
-
-        # Calculate proper dimensions for object
-        bbox_min, bbox_max, dimensions = calculate_object_bounds(obj)
-
-        if polygon_count > 0 and max(dimensions) > 0.001:  # At least 1mm
-            category = classify_name(obj.name, CATEGORY_PATTERNS) or 'props'
-
-            data['file_info']['objects'].append({
-                'name': obj.name,
-                'type': 'object',
-                'polygon_count': polygon_count,
-                'vertex_count': vertex_count,
-                'dimensions': dimensions,
-                'bbox_min': bbox_min,
-                'bbox_max': bbox_max,
-                'category': category,
-                'complexity_score': calculate_complexity(polygon_count, 1),
-                'quality_tier': determine_quality(polygon_count),
-                'has_geometry': True
-            })
-            print(f"✅ STANDALONE: Object {obj.name} - {polygon_count} polys, dims: {[round(d, 3) for d in dimensions]}")
-        else:
-            print(f"⚠️  SKIPPED: Object {obj.name} - {polygon_count} polys, dims: {[round(d, 3) for d in dimensions]}")
+    data['file_info']['objects'] = collect_standalone_objects(objects_in_collections, visual_names)
 
     collections = len(data['file_info']['collections'])
     objects = len(data['file_info']['objects'])
@@ -942,17 +1335,10 @@ def main():
         return """
 def main():
     \"\"\"Extract standalone objects not in named collections.\"\"\"
-    # Ensure the blend file is properly loaded
-    try:
-        if not bpy.data.filepath:
-            if '--background' in sys.argv:
-                blend_file_idx = sys.argv.index('--background') + 1
-                if blend_file_idx < len(sys.argv):
-                    blend_file = sys.argv[blend_file_idx]
-                    if os.path.exists(blend_file):
-                        bpy.ops.wm.open_mainfile(filepath=blend_file)
-    except Exception:
-        pass  # File already loaded via --background
+    # Explicitly open the blend file
+    if blend_file_path and os.path.exists(blend_file_path):
+        if not bpy.data.filepath or bpy.data.filepath != blend_file_path:
+            bpy.ops.wm.open_mainfile(filepath=blend_file_path)
 
     data = {
         'file_info': {
@@ -966,46 +1352,16 @@ def main():
 
     # Track objects in excluded collections (including child collections recursively)
     objects_in_collections = set()
+    visual_names = get_visual_object_names()
     for coll_name in EXCLUDED_COLLECTIONS:
-        for collection in bpy.data.collections:
-            if collection.name == coll_name:
-                for obj in get_all_collection_objects(collection):
-                    objects_in_collections.add(obj.name)
-                break
+        collection = bpy.data.collections.get(coll_name)
+        if collection is not None:
+            objects_in_collections.update(
+                obj.name for obj in get_all_collection_objects(collection, visual_names)
+            )
 
     # Process standalone objects
-    for obj in bpy.data.objects:
-        # Skip if in an excluded collection
-        if obj.name in objects_in_collections:
-            continue
-
-        if not is_visual_object(obj) or len(obj.users_collection) > 1:
-            continue
-
-        if should_skip_object_name(obj.name):
-            continue
-
-        polygon_count = get_polygon_count(obj)
-        vertex_count = get_vertex_count(obj)
-        bbox_min, bbox_max, dimensions = calculate_object_bounds(obj)
-
-        if polygon_count > 0 and max(dimensions) > 0.001:
-            category = classify_name(obj.name, CATEGORY_PATTERNS) or 'props'
-
-            data['file_info']['objects'].append({
-                'name': obj.name,
-                'type': 'object',
-                'polygon_count': polygon_count,
-                'vertex_count': vertex_count,
-                'dimensions': dimensions,
-                'bbox_min': bbox_min,
-                'bbox_max': bbox_max,
-                'category': category,
-                'complexity_score': calculate_complexity(polygon_count, 1),
-                'quality_tier': determine_quality(polygon_count),
-                'has_geometry': True
-            })
-            print(f"✅ STANDALONE: {obj.name} - {polygon_count} polys, dims: {[round(d, 3) for d in dimensions]}")
+    data['file_info']['objects'] = collect_standalone_objects(objects_in_collections, visual_names)
 
     print(f"📊 Found {len(data['file_info']['objects'])} standalone objects")
     return data
@@ -1024,7 +1380,7 @@ def main():
         return any(indicator in error_str for indicator in transient_indicators)
 
     def _extract_with_retry(self, blend_file_path: str, collection_name: str,
-                           pack_id: int, max_retries: int = 2) -> int:
+                           pack_id: int, max_retries: int = 2) -> Tuple[int, int]:
         """
         Extract collection with automatic retry on transient failures.
 
@@ -1035,7 +1391,7 @@ def main():
             max_retries: Maximum number of retry attempts (default: 2)
 
         Returns:
-            Number of assets created
+            (assets created, asset rows rejected)
         """
         for attempt in range(max_retries + 1):
             try:
@@ -1052,164 +1408,60 @@ def main():
                     continue
                 raise
 
-    def _extract_single_collection(self, blend_file_path: str, collection_name: str, pack_id: int) -> int:
+    def _extract_single_collection(self, blend_file_path: str, collection_name: str, pack_id: int) -> Tuple[int, int]:
         """
         Extract data for a single collection from a blend file (memory-efficient).
-        Returns number of assets created.
+        Returns (assets created, asset rows rejected).
         """
-        # Use unified script generator
-        script_content = self._create_extraction_script(
-            mode='single_collection',
-            blend_file_path=blend_file_path,
-            collection_name=collection_name
+        # The worker keeps the file open from the quick scan, so each
+        # collection costs only its own extraction.
+        # 5 minutes per collection (generous for large collections)
+        extraction_data = self._get_worker().call(
+            'extract_collection', path=blend_file_path, collection=collection_name, timeout=300
         )
 
-        # Validate script before execution
-        self._validate_script_generation(script_content, 'single_collection')
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as script_file:
-            script_file.write(script_content)
-            script_path = script_file.name
+        if 'error' in extraction_data:
+            error_msg = extraction_data['error']
+            traceback_info = extraction_data.get('traceback', '')
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = output_file.name
+            logger.error(f"Collection extraction failed: {collection_name}")
+            logger.error(f"Error: {error_msg}")
+            if traceback_info:
+                logger.debug(f"Traceback: {traceback_info}")
 
-        try:
-            # Run Blender subprocess for this collection only
-            # Pass blend file path explicitly as argument for robustness
-            cmd = [
-                self.blender_executable,
-                "--background",
-                "--python", script_path,
-                "--", blend_file_path, output_path
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minutes per collection (generous for large collections)
-                cwd=os.path.dirname(blend_file_path)
-            )
-
-            if result.returncode != 0:
-                error_details = f"Collection extraction failed (code {result.returncode})"
-                if result.stderr:
-                    error_details += f"\nSTDERR: {result.stderr[-1000:]}"
-                if result.stdout:
-                    error_details += f"\nSTDOUT (last 500): {result.stdout[-500:]}"
-                raise Exception(error_details)
-
-            # Read and process results
-            if not os.path.exists(output_path):
-                raise Exception("No output data generated")
-
-            with open(output_path, 'r') as f:
-                extraction_data = json.load(f)
-
-            if 'error' in extraction_data:
-                error_msg = extraction_data['error']
-                traceback_info = extraction_data.get('traceback', '')
-
-                logger.error(f"Collection extraction failed: {collection_name}")
-                logger.error(f"Error: {error_msg}")
-                if traceback_info:
-                    logger.debug(f"Traceback: {traceback_info}")
-
-                raise Exception(f"Extraction failed: {error_msg}")
+            raise Exception(f"Extraction failed: {error_msg}")
 
-            # Store the collection data
-            return self._store_extracted_data(extraction_data, pack_id, blend_file_path)
+        # Store the collection data
+        return self._store_extracted_data(extraction_data, pack_id, blend_file_path)
 
-        finally:
-            # Clean up temp files
-            for temp_path in [script_path, output_path]:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except Exception as e:
-                    logger.debug(f"Failed to cleanup temp file {temp_path}: {e}")
-
-    def _extract_standalone_objects(self, blend_file_path: str, excluded_collections: List[str], pack_id: int) -> int:
+    def _extract_standalone_objects(self, blend_file_path: str, excluded_collections: List[str], pack_id: int) -> Tuple[int, int]:
         """
         Extract standalone objects (not in named collections) from a blend file.
         excluded_collections: List of collection names that have already been processed.
-        Returns number of assets created.
+        Returns (assets created, asset rows rejected).
         """
-        # Use unified script generator
-        script_content = self._create_extraction_script(
-            mode='standalone',
-            blend_file_path=blend_file_path,
-            excluded_collections=excluded_collections
+        # 3 minutes for standalone objects
+        extraction_data = self._get_worker().call(
+            'extract_standalone', path=blend_file_path, excluded=excluded_collections, timeout=180
         )
 
-        # Validate script before execution
-        self._validate_script_generation(script_content, 'standalone')
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as script_file:
-            script_file.write(script_content)
-            script_path = script_file.name
+        if 'error' in extraction_data:
+            error_msg = extraction_data['error']
+            traceback_info = extraction_data.get('traceback', 'No traceback available')
+            logger.error(f"Standalone extraction failed: {error_msg}")
+            logger.error(f"Full traceback:\n{traceback_info}")
+            raise Exception(f"Extraction failed: {error_msg}")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = output_file.name
-
-        try:
-            # Run Blender subprocess for standalone objects with explicit file path argument
-            cmd = [
-                self.blender_executable,
-                "--background",
-                "--python", script_path,
-                "--", blend_file_path, output_path
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=180,  # 3 minutes for standalone objects
-                cwd=os.path.dirname(blend_file_path)
-            )
+        # Store the standalone object data
+        return self._store_extracted_data(extraction_data, pack_id, blend_file_path)
 
-            if result.returncode != 0:
-                error_details = f"Standalone extraction failed (code {result.returncode})"
-                if result.stderr:
-                    error_details += f"\nSTDERR: {result.stderr[-1000:]}"
-                if result.stdout:
-                    error_details += f"\nSTDOUT (last 500): {result.stdout[-500:]}"
-                raise Exception(error_details)
-
-            # Read and process results
-            if not os.path.exists(output_path):
-                raise Exception("No output data generated")
-
-            with open(output_path, 'r') as f:
-                extraction_data = json.load(f)
-
-            if 'error' in extraction_data:
-                error_msg = extraction_data['error']
-                traceback_info = extraction_data.get('traceback', 'No traceback available')
-                logger.error(f"Standalone extraction failed: {error_msg}")
-                logger.error(f"Full traceback:\n{traceback_info}")
-                raise Exception(f"Extraction failed: {error_msg}")
-
-            # Store the standalone object data
-            return self._store_extracted_data(extraction_data, pack_id, blend_file_path)
-
-        finally:
-            # Clean up temp files
-            for temp_path in [script_path, output_path]:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except Exception as e:
-                    logger.debug(f"Failed to cleanup temp file {temp_path}: {e}")
-
-    def _process_large_blend_file(self, blend_file_path: str, pack_id: int) -> int:
+    def _process_large_blend_file(self, blend_file_path: str, pack_id: int) -> Tuple[int, int, int]:
         """
         Process large blend files using per-collection extraction.
         Memory-efficient approach that extracts one collection at a time.
+
+        Returns:
+            (assets created, rows rejected, failures) like _process_blend_file
         """
         logger.info("=" * 60)
         logger.info("LARGE FILE PROCESSING - PER-COLLECTION EXTRACTION")
@@ -1233,27 +1485,33 @@ def main():
         # Phase 2: Extract each collection individually
         logger.info(f"\nPhase 2: Extracting collections individually...")
         total_assets = 0
+        total_rejected = 0
+        failures = 0
         failed_collections = []
 
         for i, coll_name in enumerate(collections):
             logger.info(f"  [{i+1}/{len(collections)}] Extracting: {coll_name}")
             try:
-                assets_created = self._extract_with_retry(blend_file_path, coll_name, pack_id)
+                assets_created, rejected = self._extract_with_retry(blend_file_path, coll_name, pack_id)
                 total_assets += assets_created
+                total_rejected += rejected
                 logger.info(f"    ✅ Created {assets_created} asset(s)")
             except Exception as e:
                 logger.error(f"    ❌ Failed: {e}")
                 failed_collections.append(coll_name)
+                failures += 1
                 continue
 
         # Phase 3: Extract standalone objects (background props)
         logger.info(f"\nPhase 3: Extracting standalone objects...")
         try:
-            standalone_assets = self._extract_standalone_objects(blend_file_path, collections, pack_id)
+            standalone_assets, rejected = self._extract_standalone_objects(blend_file_path, collections, pack_id)
             total_assets += standalone_assets
+            total_rejected += rejected
             logger.info(f"  ✅ Created {standalone_assets} standalone asset(s)")
         except Exception as e:
             logger.error(f"  ❌ Standalone extraction failed: {e}")
+            failures += 1
 
         # Summary
         logger.info("\n" + "=" * 60)
@@ -1264,44 +1522,56 @@ def main():
             logger.warning(f"  Failed collections: {', '.join(failed_collections)}")
         logger.info("=" * 60)
 
-        return total_assets
+        return total_assets, total_rejected, failures
 
     # ============================================================================
     # Data Storage
     # ============================================================================
 
-    def _store_extracted_data(self, data: Dict, pack_id: int, blend_file_path: str) -> int:
-        """Store extracted asset data with improved dimension handling."""
+    def _store_extracted_data(self, data: Dict, pack_id: int, blend_file_path: str) -> Tuple[int, int]:
+        """Store extracted asset data; returns (assets created, rows rejected)."""
         if not data.get('success') or 'error' in data:
             raise Exception(data.get('error', 'Extraction failed'))
-        
-        file_info = data['file_info']
-        relative_path = os.path.relpath(blend_file_path, self.db.get_asset_pack(pack_id)['path'])
+
+        with self._db_lock:
+            return self._store_file_info(data['file_info'], pack_id, blend_file_path)
+
+    def _store_file_info(self, file_info: Dict, pack_id: int, blend_file_path: str) -> Tuple[int, int]:
+        """
+        Write one file's collections and objects in one transaction (caller holds _db_lock).
+
+        Returns:
+            (assets created, asset rows the database rejected)
+        """
+        relative_path = os.path.relpath(blend_file_path, self._get_pack_path(pack_id))
+
+        items = [('collection', data) for data in file_info.get('collections', [])]
+        items += [('object', data) for data in file_info.get('objects', [])]
+        records = [self._build_asset_record(data, pack_id, relative_path, blend_file_path)
+                   for _kind, data in items]
+
         assets_created = 0
-        
-        # Store collections
-        for coll_data in file_info.get('collections', []):
-            try:
-                asset_id = self._create_database_asset_improved(coll_data, pack_id, relative_path, blend_file_path)
-                assets_created += 1
-                logger.info(f"Created collection asset: {coll_data['name']} with dims: {coll_data.get('dimensions', [0,0,0])}")
-            except Exception as e:
-                logger.error(f"Failed to create collection asset {coll_data['name']}: {e}")
-        
-        # Store objects
-        for obj_data in file_info.get('objects', []):
-            try:
-                asset_id = self._create_database_asset_improved(obj_data, pack_id, relative_path, blend_file_path)
-                assets_created += 1
-                logger.info(f"Created object asset: {obj_data['name']} with dims: {obj_data.get('dimensions', [0,0,0])}")
-            except Exception as e:
-                logger.error(f"Failed to create object asset {obj_data['name']}: {e}")
-        
-        return assets_created
+        rejected = 0
+        for (kind, asset_data), (asset_id, error) in zip(items, self.db.create_assets_bulk(records)):
+            if asset_id is None:
+                logger.error(f"Failed to create {kind} asset {asset_data['name']}: {error}")
+                rejected += 1
+                continue
+            assets_created += 1
+            logger.info(f"Created {kind} asset: {asset_data['name']} with dims: {asset_data.get('dimensions', [0,0,0])}")
+
+        return assets_created, rejected
     
-    def _create_database_asset_improved(self, asset_data: Dict, pack_id: int, 
-                                       relative_path: str, blend_file_path: str) -> int:
-        """Create single asset entry with improved dimension handling."""
+    def _get_pack_path(self, pack_id: int) -> str:
+        """Root path of a pack, fetched once per scanner (caller holds _db_lock)."""
+        pack_path = self._pack_paths.get(pack_id)
+        if pack_path is None:
+            pack_path = self._pack_paths[pack_id] = self.db.get_asset_pack(pack_id)['path']
+        return pack_path
+
+    def _build_asset_record(self, asset_data: Dict, pack_id: int,
+                            relative_path: str, blend_file_path: str) -> Dict:
+        """Build the create_assets_bulk() entry for one asset, with improved dimension handling."""
         # Extract data with defaults
         polygon_count = asset_data.get('polygon_count', 0)
         vertex_count = asset_data.get('vertex_count', 0)
@@ -1315,15 +1585,12 @@ def main():
         if not isinstance(dimensions, list) or len(dimensions) < 3:
             dimensions = [0.0, 0.0, 0.0]
 
-        # Extract width, height, depth from dimensions
-        width, height, depth = dimensions[0], dimensions[1], dimensions[2]
-
-        # Validate dimensions are reasonable numbers
-        for i, dim in enumerate([width, height, depth]):
-            if not isinstance(dim, (int, float)) or dim < 0 or dim > 10000:  # Max 10km
-                if i == 0: width = 0.0
-                elif i == 1: height = 0.0 
-                else: depth = 0.0
+        # Extract width, height, depth, zeroing anything that isn't a reasonable
+        # number (negative, NaN, or over 10km)
+        width, height, depth = [
+            dim if isinstance(dim, (int, float)) and 0 <= dim <= 10000 else 0.0
+            for dim in dimensions[:3]
+        ]
 
         # Store bounding box info if available
         bbox_min = asset_data.get('bbox_min', [0.0, 0.0, 0.0])
@@ -1334,8 +1601,19 @@ def main():
         collection_name = asset_data['name'] if asset_data.get('type') == 'collection' else None
         object_name = asset_data['name'] if asset_data.get('type') == 'object' else None
 
-        # Create asset in database
-        asset_id = self.db.create_asset_optimized(
+        asset_properties = []
+        if bbox_min and bbox_max:
+            asset_properties = [
+                ('technical', 'bbox_min', json.dumps(bbox_min), 'json'),
+                ('technical', 'bbox_max', json.dumps(bbox_max), 'json'),
+            ]
+
+        # Add category tag
+        tags = []
+        if asset_data.get('category'):
+            tags.append((asset_data['category'], 'category', 1.0))
+
+        return dict(
             name=asset_data['name'],
             pack_id=pack_id,
             category=asset_data.get('category', 'props'),
@@ -1355,42 +1633,10 @@ def main():
             primary_style=None,
             size_category=self._determine_size_category(width, height, depth),
             # --- Add object_name for object assets ---
-            object_name=object_name
+            object_name=object_name,
+            asset_properties=asset_properties,
+            tags=tags
         )
-
-        # Store additional metadata as properties
-        try:
-            if bbox_min and bbox_max:
-                # Store bounding box data
-                with self.db.get_connection() as conn:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO asset_properties 
-                        (asset_id, property_type, property_key, property_value, data_type)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (asset_id, 'technical', 'bbox_min', json.dumps(bbox_min), 'json'))
-
-                    conn.execute("""
-                        INSERT OR REPLACE INTO asset_properties 
-                        (asset_id, property_type, property_key, property_value, data_type)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (asset_id, 'technical', 'bbox_max', json.dumps(bbox_max), 'json'))
-
-                    conn.commit()
-
-            # Add category tag
-            if asset_data.get('category'):
-                with self.db.get_connection() as conn:
-                    conn.execute("""
-                        INSERT OR IGNORE INTO asset_tags 
-                        (asset_id, tag_name, tag_category, confidence)
-                        VALUES (?, ?, ?, ?)
-                    """, (asset_id, asset_data['category'], 'category', 1.0))
-                    conn.commit()
-
-        except Exception as e:
-            logger.warning(f"Failed to add asset metadata for {asset_data['name']}: {e}")
-
-        return asset_id
     
     def _determine_size_category(self, width: float, height: float, depth: float) -> str:
         """Determine size category based on dimensions."""
@@ -1409,21 +1655,15 @@ def main():
     # Reporting
     # ============================================================================
 
-    def _create_summary(self, pack_id: int, processed: int, failed: int, start_time: float) -> Dict[str, Any]:
+    def _create_summary(self, pack_id: int, processed: int, failed: int, start_time: float,
+                        skipped: int = 0) -> Dict[str, Any]:
         """Create scan summary with results."""
         end_time = time.time()
         duration = end_time - start_time
         
-        # Get pack info and assets
+        # Get pack info and let SQLite do the counting
         pack_info = self.db.get_asset_pack(pack_id)
-        assets = self.db.fast_asset_search(pack_id=pack_id, limit=10000)
-        
-        # Count by category
-        category_counts = defaultdict(int)
-        quality_counts = defaultdict(int)
-        for asset in assets:
-            category_counts[asset['category']] += 1
-            quality_counts[asset['quality_tier']] += 1
+        breakdown = self.db.get_pack_breakdown(pack_id)
         
         return {
             'pack_info': pack_info,
@@ -1431,11 +1671,12 @@ def main():
                 'files_queued': processed + failed,
                 'files_processed': processed,
                 'files_failed': failed,
+                'files_unchanged': skipped,
                 'duration_seconds': duration
             },
-            'total_assets': len(assets),
-            'category_breakdown': dict(category_counts),
-            'quality_breakdown': dict(quality_counts),
+            'total_assets': sum(breakdown['categories'].values()),
+            'category_breakdown': breakdown['categories'],
+            'quality_breakdown': breakdown['quality_tiers'],
             'database_stats': self.db.get_database_stats()
         }
 
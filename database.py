@@ -8,6 +8,7 @@ import sqlite3
 import json
 import os
 import logging
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
 from datetime import datetime
@@ -22,19 +23,27 @@ class AssetDatabase:
     Manages the SQLite database for asset intelligence.
     Optimized for high-speed queries with hybrid normalization.
     """
+
+    SCHEMA_VERSION = 4  # Version _run_migrations() brings the file up to
     
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize database connection and ensure schema exists."""
-        if db_path is None:
-            # Store database in Blender's user config directory
-            config_path = bpy.utils.user_resource('CONFIG')
-            self.db_path = os.path.join(config_path, "bms_asset_intelligence.db")
-        else:
-            self.db_path = db_path
+    def __init__(self, db_path: Optional[str] = None, initialize: bool = True):
+        """
+        Initialize database connection and ensure schema exists.
+
+        Args:
+            db_path: Path to database file. If None, uses default location.
+            initialize: If False, skip schema creation and migrations (the file
+                        is assumed to already hold a usable schema).
+        """
+        # Store database in Blender's user config directory by default
+        self.db_path = db_path or get_default_db_path()
 
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
+        if not initialize:
+            return
+
         # Initialize schema and run migrations if needed
         self._initialize_schema()
         self._run_migrations()
@@ -49,6 +58,10 @@ class AssetDatabase:
             conn.row_factory = sqlite3.Row  # Enable column access by name
             # Enable JSON support
             conn.execute("PRAGMA foreign_keys = ON")
+            # Safe with WAL and avoids an fsync on every scanner commit
+            conn.execute("PRAGMA synchronous = NORMAL")
+            # Sorts and GROUP BYs in the stats/filter queries stay off disk
+            conn.execute("PRAGMA temp_store = MEMORY")
             yield conn
         except sqlite3.Error as e:
             if conn:
@@ -255,9 +268,26 @@ class AssetDatabase:
         CREATE INDEX IF NOT EXISTS idx_patterns_lookup ON classification_patterns(pattern_type, priority);
         CREATE INDEX IF NOT EXISTS idx_scan_queue_status ON scan_queue(status, priority);
         CREATE INDEX IF NOT EXISTS idx_tags_fast ON asset_tags(asset_id, tag_category);
+        -- Fingerprints of scanned blend files, so rescans can skip unchanged files
+        CREATE TABLE IF NOT EXISTS scanned_files (
+            pack_id INTEGER NOT NULL,
+            blend_file_path TEXT NOT NULL,
+            fingerprint TEXT NOT NULL, -- "size:mtime_ns"
+            assets_created INTEGER DEFAULT 0,
+            scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (pack_id, blend_file_path),
+            FOREIGN KEY (pack_id) REFERENCES asset_packs (id) ON DELETE CASCADE
+        );
+
+        -- Cover the remaining ON DELETE CASCADE columns so deleting assets doesn't scan these tables
+        CREATE INDEX IF NOT EXISTS idx_relationships_asset_2 ON asset_relationships(asset_2_id);
+        CREATE INDEX IF NOT EXISTS idx_rules_asset ON asset_rules(asset_id);
         """
         
         with self.get_connection() as conn:
+            # WAL is persistent, so setting it once here covers every later connection;
+            # readers (UI panels) no longer block on scanner writes
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(schema_sql)
             conn.commit()
             self._populate_default_patterns()
@@ -290,7 +320,7 @@ class AssetDatabase:
     def _run_migrations(self):
         """Run database migrations to upgrade schema."""
         current_version = self._get_schema_version()
-        target_version = 3  # Current schema version
+        target_version = self.SCHEMA_VERSION
 
         if current_version >= target_version:
             return
@@ -350,6 +380,11 @@ class AssetDatabase:
                 logger.error("Please delete the database file and restart Blender to recreate it")
                 raise
 
+        # Migration v3 -> v4: scanned_files table (created by _initialize_schema)
+        if current_version < 4:
+            self._set_schema_version(4)
+            current_version = 4
+
         logger.info(f"Database migration complete: now at v{current_version}")
 
     def _populate_default_patterns(self):
@@ -456,9 +491,20 @@ class AssetDatabase:
             conn.commit()
     
     # Fast Asset Operations (using denormalized data)
-    def create_asset_optimized(self, name: str, pack_id: int, category: str,
-                             blend_file_path: str, **properties) -> int:
-        """Create asset with critical properties denormalized for performance."""
+    _INSERT_ASSET_SQL = """
+        INSERT INTO assets (
+            name, pack_id, category, subcategory, file_path, collection_name, object_name,
+            blend_file_path, polygon_count, vertex_count, material_count,
+            object_count, width, height, depth, volume,
+            bbox_center_x, bbox_center_y, bbox_center_z,
+            complexity_score, quality_tier, estimated_load_time, memory_estimate,
+            primary_style, size_category, scan_status, last_scanned
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'complete', ?)
+    """
+
+    def _asset_row(self, name: str, pack_id: int, category: str,
+                   blend_file_path: str, **properties) -> Tuple:
+        """Build the parameter tuple for _INSERT_ASSET_SQL."""
 
         # Extract critical properties with defaults
         polygon_count = properties.get('polygon_count', 0)
@@ -489,26 +535,74 @@ class AssetDatabase:
         object_name = properties.get('object_name')
         file_path = properties.get('file_path', '')
 
+        return (
+            name, pack_id, category, subcategory, file_path, collection_name, object_name,
+            blend_file_path, polygon_count, vertex_count, material_count,
+            object_count, width, height, depth, volume,
+            bbox_center_x, bbox_center_y, bbox_center_z,
+            complexity_score, quality_tier, estimated_load_time, memory_estimate,
+            primary_style, size_category, datetime.now()
+        )
+
+    def create_asset_optimized(self, name: str, pack_id: int, category: str,
+                             blend_file_path: str, **properties) -> int:
+        """Create asset with critical properties denormalized for performance."""
+        row = self._asset_row(name, pack_id, category, blend_file_path, **properties)
+
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO assets (
-                    name, pack_id, category, subcategory, file_path, collection_name, object_name,
-                    blend_file_path, polygon_count, vertex_count, material_count,
-                    object_count, width, height, depth, volume,
-                    bbox_center_x, bbox_center_y, bbox_center_z,
-                    complexity_score, quality_tier, estimated_load_time, memory_estimate,
-                    primary_style, size_category, scan_status, last_scanned
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'complete', ?)
-            """, (
-                name, pack_id, category, subcategory, file_path, collection_name, object_name,
-                blend_file_path, polygon_count, vertex_count, material_count,
-                object_count, width, height, depth, volume,
-                bbox_center_x, bbox_center_y, bbox_center_z,
-                complexity_score, quality_tier, estimated_load_time, memory_estimate,
-                primary_style, size_category, datetime.now()
-            ))
+            cursor = conn.execute(self._INSERT_ASSET_SQL, row)
             conn.commit()
             return cursor.lastrowid
+
+    def create_assets_bulk(self, assets: List[Dict]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Create many assets, with their properties and tags, in one transaction.
+
+        Each entry holds the create_asset_optimized() arguments plus optional
+        'asset_properties' rows (property_type, property_key, property_value,
+        data_type) and 'tags' rows (tag_name, tag_category, confidence).
+        A row that fails (e.g. a duplicate name) is skipped without affecting
+        the others.
+
+        Returns:
+            One (asset_id, None) or (None, error message) pair per entry
+        """
+        results = []
+        property_rows = []
+        tag_rows = []
+
+        with self.get_connection() as conn:
+            for asset in assets:
+                asset = dict(asset)
+                asset_properties = asset.pop('asset_properties', ())
+                tags = asset.pop('tags', ())
+                try:
+                    asset_id = conn.execute(self._INSERT_ASSET_SQL, self._asset_row(**asset)).lastrowid
+                except sqlite3.Error as e:
+                    results.append((None, str(e)))
+                    continue
+
+                results.append((asset_id, None))
+                property_rows.extend((asset_id,) + tuple(row) for row in asset_properties)
+                tag_rows.extend((asset_id,) + tuple(row) for row in tags)
+
+            try:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO asset_properties
+                    (asset_id, property_type, property_key, property_value, data_type)
+                    VALUES (?, ?, ?, ?, ?)
+                """, property_rows)
+                conn.executemany("""
+                    INSERT OR IGNORE INTO asset_tags
+                    (asset_id, tag_name, tag_category, confidence)
+                    VALUES (?, ?, ?, ?)
+                """, tag_rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to add asset metadata: {e}")
+
+            conn.commit()
+
+        return results
     
     def fast_asset_search(self, category: str = None, style: str = None, 
                          quality_tier: str = None, size_category: str = None,
@@ -706,6 +800,32 @@ class AssetDatabase:
                 return [dict(row) for row in cursor.fetchall()]
     
     # Keep all other methods from original implementation
+    def get_file_fingerprints(self, pack_id: int) -> Dict[str, str]:
+        """Fingerprints recorded by the last scan of each blend file in a pack."""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT blend_file_path, fingerprint FROM scanned_files WHERE pack_id = ?", (pack_id,)
+            )
+            return {row['blend_file_path']: row['fingerprint'] for row in cursor.fetchall()}
+
+    def record_scanned_files(self, pack_id: int, files: List[Tuple[str, str, int]]):
+        """Store (blend_file_path, fingerprint, assets_created) for successfully scanned files."""
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO scanned_files (pack_id, blend_file_path, fingerprint, assets_created)
+                VALUES (?, ?, ?, ?)
+            """, [(pack_id,) + tuple(row) for row in files])
+            conn.commit()
+
+    def delete_file_assets(self, pack_id: int, blend_file_paths: List[str]):
+        """Remove the assets previously extracted from the given blend files."""
+        with self.get_connection() as conn:
+            conn.executemany(
+                "DELETE FROM assets WHERE pack_id = ? AND blend_file_path = ?",
+                [(pack_id, path) for path in blend_file_paths]
+            )
+            conn.commit()
+
     def create_asset_pack(self, name: str, path: str, version: str = None, description: str = None) -> int:
         """Create a new asset pack entry."""
         with self.get_connection() as conn:
@@ -752,6 +872,26 @@ class AssetDatabase:
             
             return stats
 
+    def get_pack_breakdown(self, pack_id: int) -> Dict[str, Dict[str, int]]:
+        """Count a pack's active assets by category and by quality tier."""
+        with self.get_connection() as conn:
+            categories = dict(conn.execute("""
+                SELECT category, COUNT(*) FROM assets
+                WHERE pack_id = ? AND is_active = 1
+                GROUP BY category ORDER BY COUNT(*) DESC
+            """, (pack_id,)).fetchall())
+            quality_tiers = dict(conn.execute("""
+                SELECT quality_tier, COUNT(*) FROM assets
+                WHERE pack_id = ? AND is_active = 1
+                GROUP BY quality_tier ORDER BY COUNT(*) DESC
+            """, (pack_id,)).fetchall())
+            return {'categories': categories, 'quality_tiers': quality_tiers}
+
+
+def get_default_db_path() -> str:
+    """Get the default database location in Blender's user config directory."""
+    config_path = bpy.utils.user_resource('CONFIG')
+    return os.path.join(config_path, "bms_asset_intelligence.db")
 
 # Dependency injection-friendly factory
 def create_database(db_path: str = None) -> AssetDatabase:
@@ -760,14 +900,67 @@ def create_database(db_path: str = None) -> AssetDatabase:
 
 # Global instance for convenience (but not required)
 _db_instance = None
+# Held while the global instance is built, so schema setup and migrations
+# never run twice at once and nobody gets a handle mid-migration
+_db_instance_lock = threading.Lock()
 
 def get_database() -> AssetDatabase:
-    """Get the global database instance (singleton pattern)."""
+    """
+    Get the global database instance (singleton pattern).
+
+    Blocks while refresh_in_background() is still migrating the schema.
+    """
     global _db_instance
     if _db_instance is None:
-        _db_instance = AssetDatabase()
+        with _db_instance_lock:
+            if _db_instance is None:
+                _db_instance = AssetDatabase()
+    return _db_instance
+
+def load_cached_handle(db_path: str = None) -> Optional[AssetDatabase]:
+    """
+    Serve the existing database file immediately, without schema work.
+
+    If a database file from a previous session exists and its schema is
+    already current, it becomes the global instance right away so the add-on
+    is usable while refresh_in_background() revalidates it. An outdated file
+    is not served: get_database() waits for the migration instead. Returns
+    None if no handle could be served.
+    """
+    global _db_instance
+    with _db_instance_lock:
+        if _db_instance is None:
+            handle = AssetDatabase(db_path, initialize=False)
+            if not os.path.exists(handle.db_path):
+                return None
+            if handle._get_schema_version() < AssetDatabase.SCHEMA_VERSION:
+                logger.info("Cached asset database needs migration; waiting for refresh")
+                return None
+            _db_instance = handle
+            logger.info(f"Using cached asset database: {handle.db_path}")
     return _db_instance
 
+def refresh_in_background(db_path: str = None) -> threading.Thread:
+    """
+    Initialize schema and run migrations on a worker thread.
+
+    The global instance is swapped for the refreshed one when done.
+    """
+    # Resolve the path here: bpy must not be touched from the worker thread
+    db_path = db_path or get_default_db_path()
+
+    def refresh():
+        global _db_instance
+        try:
+            with _db_instance_lock:
+                _db_instance = AssetDatabase(db_path)
+        except Exception as e:
+            logger.error(f"Background database refresh failed: {e}")
+
+    thread = threading.Thread(target=refresh, name="AssetDatabaseRefresh", daemon=True)
+    thread.start()
+    return thread
+
 def delete_database_file(db_path: str = None) -> bool:
     """
     Physically delete the database file from disk.
@@ -779,17 +972,15 @@ def delete_database_file(db_path: str = None) -> bool:
         True if file was deleted, False if file didn't exist or couldn't be deleted.
     """
     if db_path is None:
-        config_path = bpy.utils.user_resource('CONFIG')
-        db_path = os.path.join(config_path, "bms_asset_intelligence.db")
+        db_path = get_default_db_path()
 
     try:
-        if os.path.exists(db_path):
-            os.remove(db_path)
-            logger.info(f"Deleted database file: {db_path}")
-            return True
-        else:
-            logger.info(f"Database file does not exist: {db_path}")
-            return False
+        os.remove(db_path)
+        logger.info(f"Deleted database file: {db_path}")
+        return True
+    except FileNotFoundError:
+        logger.info(f"Database file does not exist: {db_path}")
+        return False
     except Exception as e:
         logger.error(f"Failed to delete database file: {e}")
         return False
@@ -805,9 +996,8 @@ def reset_database(delete_file: bool = False):
     """
     global _db_instance
 
-    if delete_file and _db_instance is not None:
-        db_path = _db_instance.db_path
+    with _db_instance_lock:
+        db_path = _db_instance.db_path if _db_instance is not None else None
         _db_instance = None
-        delete_database_file(db_path)
-    else:
-        _db_instance = None
\ No newline at end of file
+    if delete_file and db_path is not None:
+        delete_database_file(db_path)
\ No newline at end of file
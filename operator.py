@@ -2,75 +2,219 @@
 
 import bpy
 import os
+import contextlib
+import logging
 import threading
 import queue
 import time
 from datetime import datetime
-from . import backend
-from . import limit_manager
-from . import database
+from . import limit_manager, properties
 
-# Import the working scanner
-try:
-    from .asset_scanner import RobustAssetScanner
-except ImportError:
-    RobustAssetScanner = None
+logger = logging.getLogger(__name__)
+# Debug output is formatted lazily and skipped entirely at the default level
+logger.setLevel(logging.INFO)
 
 # Global queue for thread communication
 scan_progress_queue = queue.Queue()
 current_scan_timer = None
 
+# Set while a generate request is in flight, so a second click can't start
+# another API call before the first one has logged its usage
+generation_running = False
+
+
+def _ensure_db():
+    """Import and initialize the asset database on first use."""
+    from . import database
+    return database.get_database()
+
+
+def _get_scanner_class():
+    """Import the working scanner on first use (None if unavailable)."""
+    try:
+        from .asset_scanner import RobustAssetScanner
+    except ImportError:
+        return None
+    return RobustAssetScanner
+
+
+def _set_status(scene, text):
+    """Record the generation status message for a scene."""
+    properties.set_status(scene, text)
+
+
+# Nesting depth of batched_ui() blocks on the current thread
+_ui_batch = threading.local()
+
+
+@contextlib.contextmanager
+def batched_ui(context):
+    """
+    Group UI-visible writes so the current area is redrawn once at the end.
+    Reentrant: nested blocks defer to the outermost one.
+    """
+    depth = getattr(_ui_batch, "depth", 0)
+    _ui_batch.depth = depth + 1
+    try:
+        yield
+    finally:
+        _ui_batch.depth = depth
+        if depth == 0 and context.area:
+            context.area.tag_redraw()
+
+
 class WM_OT_generate_scene_operator(bpy.types.Operator):
     bl_label = "Generate Scene"
     bl_idname = "wm.generate_scene_operator"
     bl_description = "Starts the scene generation process"
 
+    _timer = None
+    _queue = None
+    _usage_data = None
+
+    @classmethod
+    def poll(cls, context):
+        return not generation_running
+
     def execute(self, context):
+        global generation_running
+        if generation_running:
+            return {'CANCELLED'}
+
+        generation_running = True
+        try:
+            with batched_ui(context):
+                result = self._start(context)
+        except Exception:
+            generation_running = False
+            raise
+        # Only a started worker keeps the flag; modal() clears it when done
+        if result != {'RUNNING_MODAL'}:
+            generation_running = False
+        return result
+
+    def _start(self, context):
+        """Validate the request and start the worker thread."""
         props = context.scene.my_tool_properties
-        
+
+        # Cheapest check first: an empty prompt never reaches the usage log or RNA writes.
+        # Whitespace-only prompts count as empty; strip() only runs for non-empty input.
+        prompt = props.prompt_input
+        if not prompt or not prompt.strip():
+            self.report({'WARNING'}, "Prompt cannot be empty.")
+            _set_status(context.scene, "Error: Prompt is empty")
+            return {'CANCELLED'}
+
+        from . import backend
         usage_data = limit_manager.load_usage_data()
         is_allowed, reason, cooldown = limit_manager.check_limits(usage_data)
         
         if not is_allowed:
-            props.status_text = reason
+            _set_status(context.scene, reason)
             props.cooldown_timer = cooldown
             self.report({'WARNING'}, f"API Limit Reached: {reason}")
             return {'CANCELLED'}
-            
-        props.cooldown_timer = 0
-        props.status_text = "Processing..."
-        
-        if props.prompt_input == "":
-            self.report({'WARNING'}, "Prompt cannot be empty.")
-            props.status_text = "Error: Prompt is empty"
-            return {'CANCELLED'}
+
+        if props.cooldown_timer:
+            props.cooldown_timer = 0
 
         # Asset Intelligence is mandatory - always use assets
         try:
+            # First generation pays for database initialization
+            _ensure_db()
+
             # Get filtered assets from cache (no redundant database query)
             available_assets = props.get_filtered_assets(limit=100)
 
-            if not available_assets:
-                props.status_text = "Error: No assets found. Scan asset pack or adjust filters."
-                self.report({'ERROR'}, "No assets found. Please scan an asset pack or adjust your filters.")
-                return {'CANCELLED'}
+        except Exception as e:
+            _set_status(context.scene, f"Error: {str(e)}")
+            self.report({'ERROR'}, f"Asset generation failed: {e}")
+            return {'CANCELLED'}
 
-            props.status_text = f"Generating with {len(available_assets)} assets..."
-            # Enhanced scene generation with asset intelligence
-            instructions = backend.call_ai_service_with_assets(
-                props.prompt_input,
-                props.scene_style,
-                props.object_count,
-                available_assets
-            )
+        if not available_assets:
+            _set_status(context.scene, "Error: No assets found. Scan asset pack or adjust filters.")
+            self.report({'ERROR'}, "No assets found. Please scan an asset pack or adjust your filters.")
+            return {'CANCELLED'}
+
+        _set_status(context.scene, f"Generating with {len(available_assets)} assets...")
+
+        # scene_style is an index; the AI prompt wants the style identifier
+        style_id = props.scene_style
+        style = properties.STYLES[style_id][0]
 
+        # The AI call runs in a worker thread; modal() picks up its result on timer ticks
+        self._usage_data = usage_data
+        self._queue = queue.Queue()
+        worker = threading.Thread(
+            target=self._generate_thread,
+            args=(self._queue, backend, prompt, style,
+                  props.object_count, available_assets)
+        )
+        worker.daemon = True
+        worker.start()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    @staticmethod
+    def _generate_thread(result_queue, backend, prompt, style, count, available_assets):
+        """Call the AI service off the main thread (no bpy access here)."""
+        logger.debug("Generating %d objects (%s) for prompt: %s", count, style, prompt)
+        try:
+            # Enhanced scene generation with asset intelligence
+            instructions = backend.call_ai_service_with_assets(prompt, style, count, available_assets)
         except Exception as e:
-            props.status_text = f"Error: {str(e)}"
-            self.report({'ERROR'}, f"Asset generation failed: {e}")
+            result_queue.put(('error', str(e)))
+            return
+        result_queue.put(('done', instructions))
+
+    def modal(self, context, event):
+        global generation_running
+        # Idle ticks return before touching any UI state
+        if event.type != 'TIMER' or self._queue.empty():
+            return {'PASS_THROUGH'}
+
+        props = context.scene.my_tool_properties
+        with batched_ui(context):
+            while not self._queue.empty():
+                kind, payload = self._queue.get_nowait()
+
+                if kind == 'status':
+                    _set_status(context.scene, payload)
+                    continue
+
+                # Any other message is terminal: stop ticking and finish on the main thread
+                context.window_manager.event_timer_remove(self._timer)
+                self._timer = None
+                try:
+                    return self._finish(context, props, kind, payload)
+                finally:
+                    generation_running = False
+
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        """Blender dropped the modal handler (e.g. a file was loaded): free the slot."""
+        global generation_running
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        generation_running = False
+
+    def _finish(self, context, props, kind, payload):
+        """Build the scene from the worker's result."""
+        from . import backend
+
+        if kind == 'error':
+            _set_status(context.scene, f"Error: {payload}")
+            self.report({'ERROR'}, f"Asset generation failed: {payload}")
             return {'CANCELLED'}
-        
+
+        instructions = payload
         if instructions:
-            usage_data = limit_manager.log_request(usage_data)
+            usage_data = limit_manager.log_request(self._usage_data)
             limit_manager.save_usage_data(usage_data)
             
             # Update daily count property
@@ -83,10 +227,10 @@ class WM_OT_generate_scene_operator(bpy.types.Operator):
             else:
                 backend.build_scene_from_instructions(instructions)
             
-            props.status_text = "Generation Complete!"
+            _set_status(context.scene, "Generation Complete!")
             self.report({'INFO'}, "Scene generation finished.")
         else:
-            props.status_text = "Error: AI call failed. See console."
+            _set_status(context.scene, "Error: AI call failed. See console.")
             self.report({'ERROR'}, "Failed to get instructions from AI. See System Console for details.")
             return {'CANCELLED'}
         
@@ -146,6 +290,7 @@ class WM_OT_scan_assets_operator(bpy.types.Operator):
         asset_pack_path = context.scene.my_tool_properties.asset_pack_path
         asset_pack_name = context.scene.my_tool_properties.asset_pack_name
         force_rescan = context.scene.my_tool_properties.scan_force_rescan
+        max_workers = context.scene.my_tool_properties.scan_max_workers
         
         def queue_update(message, progress=None, is_complete=False, results=None):
             """Queue a status update for the main thread."""
@@ -159,15 +304,16 @@ class WM_OT_scan_assets_operator(bpy.types.Operator):
             })
         
         try:
+            RobustAssetScanner = _get_scanner_class()
             if not RobustAssetScanner:
                 queue_update("Error: Scanner not available", is_complete=True)
                 return
             
-            # Use the working scanner
-            scanner = RobustAssetScanner()
+            # Use the working scanner; 0 leaves the worker count to the scanner
+            scanner = RobustAssetScanner(max_workers=max_workers or None)
             
             queue_update("Initializing scanner...")
-            print("Asset scanning thread started")
+            logger.debug("Asset scanning thread started")
             
             # Run the scan
             pack_name = asset_pack_name if asset_pack_name else None
@@ -188,19 +334,14 @@ class WM_OT_scan_assets_operator(bpy.types.Operator):
             
             queue_update(final_message, progress=100, is_complete=True, results=results)
             
-            print("=== THREAD-SAFE SCAN RESULTS ===")
-            print(f"Files processed: {processed}")
-            print(f"Files failed: {failed}")
-            print(f"Total assets: {total_assets}")
-            print(f"Categories: {results.get('category_breakdown', {})}")
-            print(f"Duration: {duration:.1f} seconds")
+            logger.info("Scan results: %d files processed, %d failed, %d assets in %.1f seconds",
+                        processed, failed, total_assets, duration)
+            logger.debug("Categories: %s", results.get('category_breakdown', {}))
             
         except Exception as e:
             error_message = f"Scan failed: {str(e)}"
             queue_update(error_message, is_complete=True)
-            print(f"Thread-safe scanner error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Thread-safe scanner error: %s", e)
     
     def _check_scan_progress(self):
         """Timer function to check for progress updates from the scanning thread."""
@@ -234,7 +375,7 @@ class WM_OT_scan_assets_operator(bpy.types.Operator):
             return 0.2
             
         except Exception as e:
-            print(f"Error in scan progress timer: {e}")
+            logger.error("Error in scan progress timer: %s", e)
             current_scan_timer = None
             return None  # Unregister timer on error
 
@@ -248,7 +389,7 @@ class WM_OT_update_asset_stats_operator(bpy.types.Operator):
         props = context.scene.my_tool_properties
         
         try:
-            db = database.get_database()
+            db = _ensure_db()
             stats = db.get_database_stats()
             
             props.total_assets_in_db = stats.get('assets', 0)
@@ -273,6 +414,7 @@ class WM_OT_test_asset_intelligence_operator(bpy.types.Operator):
         props = context.scene.my_tool_properties
         
         try:
+            RobustAssetScanner = _get_scanner_class()
             if not RobustAssetScanner:
                 props.scan_status = "❌ Scanner not available"
                 self.report({'ERROR'}, "RobustAssetScanner not available")
@@ -325,7 +467,7 @@ class WM_OT_add_classification_pattern_operator(bpy.types.Operator):
         
         try:
             keywords_list = [k.strip() for k in self.keywords.split(',')]
-            db = database.get_database()
+            db = _ensure_db()
             db.add_classification_pattern(
                 self.pattern_type,
                 self.pattern_name,
@@ -356,7 +498,7 @@ class WM_OT_clear_asset_cache_operator(bpy.types.Operator):
             cache_manager.invalidate_cache()
             
             self.report({'INFO'}, "Asset cache cleared successfully")
-            print("🔄 Manual cache clear completed")
+            logger.info("Manual cache clear completed")
             
         except Exception as e:
             self.report({'ERROR'}, f"Failed to clear cache: {str(e)}")
@@ -365,28 +507,21 @@ class WM_OT_clear_asset_cache_operator(bpy.types.Operator):
         return {'FINISHED'}
 
 
-def register():
-    bpy.utils.register_class(WM_OT_generate_scene_operator)
-    bpy.utils.register_class(WM_OT_scan_assets_operator)
-    bpy.utils.register_class(WM_OT_update_asset_stats_operator)
-    bpy.utils.register_class(WM_OT_test_asset_intelligence_operator)
-    bpy.utils.register_class(WM_OT_add_classification_pattern_operator)
-    bpy.utils.register_class(WM_OT_clear_asset_cache_operator)
+classes = (
+    WM_OT_generate_scene_operator,
+    WM_OT_scan_assets_operator,
+    WM_OT_update_asset_stats_operator,
+    WM_OT_test_asset_intelligence_operator,
+    WM_OT_add_classification_pattern_operator,
+    WM_OT_clear_asset_cache_operator,
+)
 
-def unregister():
+def stop_scan_timer():
+    """Unregister the scan progress timer, if one is running."""
     global current_scan_timer
-    
-    # Clean up any running timers
     if current_scan_timer:
         try:
             bpy.app.timers.unregister(current_scan_timer)
         except:
             pass
         current_scan_timer = None
-    
-    bpy.utils.unregister_class(WM_OT_clear_asset_cache_operator)
-    bpy.utils.unregister_class(WM_OT_add_classification_pattern_operator)
-    bpy.utils.unregister_class(WM_OT_test_asset_intelligence_operator)
-    bpy.utils.unregister_class(WM_OT_update_asset_stats_operator)
-    bpy.utils.unregister_class(WM_OT_scan_assets_operator)
-    bpy.utils.unregister_class(WM_OT_generate_scene_operator)
\ No newline at end of file
@@ -124,6 +124,25 @@ def get_cache_manager():
     """Get the global cache manager instance."""
     return _cache_manager
 
+# Generation status per scene, keyed by scene.name_full. Kept out of the
+# PropertyGroup so status changes never go through RNA updates.
+_status = {}
+
+def set_status(scene, text):
+    """Set the generation status message shown for a scene."""
+    _status[scene.name_full] = text
+
+def get_status(scene):
+    """Get the generation status message for a scene."""
+    return _status.get(scene.name_full, "Ready")
+
+# Scene styles as (identifier, label, description); scene_style stores the index
+STYLES = (
+    ('CYBERPUNK', "Cyberpunk", "A futuristic, neon-lit dystopian style"),
+    ('FANTASY', "Fantasy", "A magical, medieval-inspired style"),
+    ('SCI_FI', "Sci-Fi", "A clean, futuristic science-fiction style"),
+)
+
 class MySceneProperties(bpy.types.PropertyGroup):
     # Original scene generation properties
     prompt_input: bpy.props.StringProperty(
@@ -140,14 +159,12 @@ class MySceneProperties(bpy.types.PropertyGroup):
         max=100
     )
 
-    scene_style: bpy.props.EnumProperty(
+    scene_style: bpy.props.IntProperty(
         name="Style",
-        description="Artistic style of the scene",
-        items=[
-            ('CYBERPUNK', "Cyberpunk", "A futuristic, neon-lit dystopian style"),
-            ('FANTASY', "Fantasy", "A magical, medieval-inspired style"),
-            ('SCI_FI', "Sci-Fi", "A clean, futuristic science-fiction style"),
-        ]
+        description="Artistic style of the scene (index into STYLES)",
+        default=0,
+        min=0,
+        max=len(STYLES) - 1
     )
 
     add_rain_effect: bpy.props.BoolProperty(
@@ -156,11 +173,6 @@ class MySceneProperties(bpy.types.PropertyGroup):
         default=False
     )
     
-    status_text: bpy.props.StringProperty(
-        name="Status",
-        default="Ready"
-    )
-
     requests_today: bpy.props.IntProperty(
         name="Requests Today",
         default=0
@@ -207,9 +219,10 @@ class MySceneProperties(bpy.types.PropertyGroup):
     
     scan_max_workers: bpy.props.IntProperty(
         name="Max Workers",
-        description="Maximum number of concurrent scanning workers",
-        default=2,
-        min=1,
+        description="Maximum number of concurrent scanning workers "
+                    "(0 = automatic: AIGEN_SCAN_WORKERS, else half the CPU cores)",
+        default=0,
+        min=0,
         max=8
     )
     
@@ -300,8 +313,25 @@ class MySceneProperties(bpy.types.PropertyGroup):
         cache_manager.invalidate_cache()
         return self.get_filtered_assets()
 
-def register():
-    bpy.utils.register_class(MySceneProperties)
+# Properties allowed to carry an update= callback. Every update callback runs
+# on each change and typically triggers a panel redraw, so new ones must be
+# added here deliberately.
+_UPDATE_WHITELIST = {
+    "asset_pack_path",
+    "total_assets_in_db",
+    "use_asset_intelligence",
+}
+
+def _check_update_callbacks(cls):
+    """Assert that only whitelisted properties declare update callbacks."""
+    for name, prop in cls.__annotations__.items():
+        keywords = getattr(prop, "keywords", {})
+        assert keywords.get("update") is None or name in _UPDATE_WHITELIST, \
+            f"{cls.__name__}.{name} has an update callback but is not in _UPDATE_WHITELIST"
+
+# Checked at import, which happens as part of enabling the add-on
+_check_update_callbacks(MySceneProperties)
 
-def unregister():
-    bpy.utils.unregister_class(MySceneProperties)
\ No newline at end of file
+classes = (
+    MySceneProperties,
+)
@@ -3,6 +3,9 @@ import bpy
 import os
 import time
 import sys
+import queue
+import shutil
+import tempfile
 
 # Import the specific functions and classes from your modules
 from . import database
@@ -259,6 +262,260 @@ def quick_database_test():
             os.remove(test_db_path)
             print("✓ Test database cleaned up")
 
+def test_database_batch_operations():
+    """Test the bulk insert, rescan fingerprint and breakdown database APIs."""
+    print("="*50)
+    print("DATABASE BATCH OPERATIONS TEST")
+    print("="*50)
+
+    test_db_path = os.path.join(os.path.dirname(__file__), "batch_test.db")
+    if os.path.exists(test_db_path):
+        os.remove(test_db_path)
+
+    try:
+        db = database.create_database(test_db_path)
+        pack_id = db.create_asset_pack("Batch Pack", "/batch/path")
+
+        # Bulk insert where the middle row is rejected (name is NOT NULL)
+        print("Testing bulk insert with one bad row...")
+        def record(name, blend_file, category, quality_tier):
+            return dict(
+                name=name, pack_id=pack_id, category=category,
+                blend_file_path=blend_file, quality_tier=quality_tier,
+                asset_properties=[('bbox', 'min_x', '0.0', 'float')],
+                tags=[(category, 'function', 1.0)]
+            )
+        results = db.create_assets_bulk([
+            record("Chair", "/batch/a.blend", "props", "low"),
+            record(None, "/batch/a.blend", "props", "low"),
+            record("Car", "/batch/b.blend", "vehicles", "high"),
+        ])
+        assert [asset_id is not None for asset_id, _error in results] == [True, False, True], results
+        assert results[1][1], "rejected row should carry an error message"
+        print(f"✓ Bulk insert stored 2 of 3 rows ({results[1][1]})")
+
+        # Breakdown counts come from the stored rows only
+        print("Testing pack breakdown...")
+        breakdown = db.get_pack_breakdown(pack_id)
+        assert breakdown['categories'] == {'props': 1, 'vehicles': 1}, breakdown
+        assert breakdown['quality_tiers'] == {'low': 1, 'high': 1}, breakdown
+        print(f"✓ Breakdown: {breakdown}")
+
+        # Fingerprints round-trip; recording a file again replaces its fingerprint
+        print("Testing scanned file fingerprints...")
+        db.record_scanned_files(pack_id, [("/batch/a.blend", "100:1", 1), ("/batch/b.blend", "200:1", 1)])
+        db.record_scanned_files(pack_id, [("/batch/b.blend", "200:2", 1)])
+        fingerprints = db.get_file_fingerprints(pack_id)
+        assert fingerprints == {"/batch/a.blend": "100:1", "/batch/b.blend": "200:2"}, fingerprints
+        print(f"✓ Fingerprints: {fingerprints}")
+
+        # Deleting a file's assets cascades to its tags and properties
+        print("Testing per-file delete cascade...")
+        db.delete_file_assets(pack_id, ["/batch/b.blend"])
+        with db.get_connection() as conn:
+            assets = conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+            tags = conn.execute("SELECT COUNT(*) FROM asset_tags").fetchone()[0]
+            props = conn.execute("SELECT COUNT(*) FROM asset_properties").fetchone()[0]
+        assert (assets, tags, props) == (1, 1, 1), (assets, tags, props)
+        assert db.get_pack_breakdown(pack_id)['categories'] == {'props': 1}
+        print("✓ Deleted file's assets, tags and properties are gone")
+
+        print("\n✓ Database batch operations test passed!")
+
+    except Exception as e:
+        print(f"\n✗ Database batch operations test failed: {e!r}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if os.path.exists(test_db_path):
+            os.remove(test_db_path)
+            print("✓ Test database cleaned up")
+
+class _FakeWorker:
+    """Stands in for BlenderWorker, answering extract_full from a file's name."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def is_alive(self):
+        return True
+
+    def call(self, op, timeout=120, **args):
+        name = os.path.splitext(os.path.basename(args['path']))[0]
+        self.calls.append((op, name))
+        if name in self.failing:
+            return {"error": f"{name} is broken", "success": False}
+        asset = {"category": "props", "polygon_count": 100, "dimensions": [1.0, 1.0, 1.0]}
+        return {"success": True, "file_info": {
+            # Every file has a "Rocks" collection, like packs that reuse collection names
+            "collections": [dict(asset, name="Rocks", type="collection")],
+            "objects": [dict(asset, name=f"{name}_Rock", type="object")],
+        }}
+
+def test_incremental_scan():
+    """Test which files a rescan extracts and fingerprints, with a stubbed Blender worker."""
+    print("="*50)
+    print("INCREMENTAL SCAN TEST")
+    print("="*50)
+
+    test_db_path = os.path.join(os.path.dirname(__file__), "incremental_test.db")
+    if os.path.exists(test_db_path):
+        os.remove(test_db_path)
+    pack_path = tempfile.mkdtemp(prefix="aigen_pack_")
+
+    def write_blend(name, size=2048):
+        with open(os.path.join(pack_path, f"{name}.blend"), "wb") as f:
+            f.write(b"\0" * size)
+
+    try:
+        db = database.create_database(test_db_path)
+        scanner = asset_scanner.RobustAssetScanner(database=db, max_workers=2)
+
+        # Rejected rows still count as scanned; extraction failures don't
+        print("Testing file tally...")
+        counts = {'processed': 0, 'failed': 0, 'files': {}}
+        scanner._tally_file("/pack/a.blend", 3, 1, 0, counts)
+        scanner._tally_file("/pack/b.blend", 2, 0, 1, counts)
+        assert counts == {'processed': 1, 'failed': 1, 'files': {"/pack/a.blend": 3}}, counts
+        print("✓ File with rejected rows kept, file with a failed extraction retried")
+
+        for name in ("a", "b", "c"):
+            write_blend(name)
+
+        def scan(worker):
+            scanner._get_worker = lambda: worker
+            result = scanner.scan_asset_pack_robust(pack_path, "Incremental Pack")
+            return result['scan_stats'], result['total_assets']
+
+        # First scan: the second "Rocks" collection is rejected and c fails
+        print("Testing first scan with a duplicate collection name...")
+        stats, total_assets = scan(_FakeWorker(failing={"c"}))
+        assert (stats['files_processed'], stats['files_failed']) == (2, 1), stats
+        assert total_assets == 3, total_assets
+        pack_id = db.get_asset_pack(name="Incremental Pack")['id']
+        fingerprinted = sorted(os.path.basename(path) for path in db.get_file_fingerprints(pack_id))
+        assert fingerprinted == ["a.blend", "b.blend"], fingerprinted
+        print(f"✓ {total_assets} assets kept, fingerprinted: {fingerprinted}")
+
+        # Second scan: only the failed file is extracted again
+        print("Testing rescan of unchanged files...")
+        worker = _FakeWorker()
+        stats, total_assets = scan(worker)
+        assert worker.calls == [("extract_full", "c")], worker.calls
+        assert (stats['files_processed'], stats['files_unchanged']) == (1, 2), stats
+        assert total_assets == 4, total_assets
+        print(f"✓ Unchanged files skipped, extracted: {worker.calls}")
+
+        # Third scan: a modified file replaces its own assets
+        print("Testing rescan of a modified file...")
+        write_blend("b", size=4096)
+        worker = _FakeWorker()
+        stats, total_assets = scan(worker)
+        assert worker.calls == [("extract_full", "b")], worker.calls
+        assert total_assets == 4, total_assets
+        print(f"✓ Modified file re-extracted, {total_assets} assets")
+
+        print("\n✓ Incremental scan test passed!")
+
+    except Exception as e:
+        print(f"\n✗ Incremental scan test failed: {e!r}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        shutil.rmtree(pack_path, ignore_errors=True)
+        if os.path.exists(test_db_path):
+            os.remove(test_db_path)
+            print("✓ Test database cleaned up")
+
+def test_scanner_helpers():
+    """Test the scanner's pure-Python helpers: classification, file discovery and worker output."""
+    print("="*50)
+    print("SCANNER HELPERS TEST")
+    print("="*50)
+
+    test_db_path = os.path.join(os.path.dirname(__file__), "helpers_test.db")
+    if os.path.exists(test_db_path):
+        os.remove(test_db_path)
+    pack_path = tempfile.mkdtemp(prefix="aigen_pack_")
+
+    try:
+        db = database.create_database(test_db_path)
+        scanner = asset_scanner.RobustAssetScanner(database=db)
+
+        # Classification: highest confidence first, earliest pattern on ties
+        print("Testing classification pattern order...")
+        helpers = {}
+        exec(scanner._get_mode_config() + scanner._get_common_extraction_functions(), helpers)
+        matchers = helpers['compile_patterns']({
+            'furniture': {'keywords': ['chair'], 'confidence': 0.6},
+            'props': {'keywords': ['chair', 'crate'], 'confidence': 0.9},
+            'lighting': {'keywords': ['lamp'], 'confidence': 0.9},
+            'empty': {'keywords': [], 'confidence': 1.0},
+            'disabled': {'keywords': ['table'], 'confidence': 0},
+            'signs': {'keywords': ['a.b'], 'confidence': 0.5},
+        })
+        classify_name = helpers['classify_name']
+        assert [name for name, _regex in matchers] == ['props', 'lighting', 'furniture', 'signs'], matchers
+        assert classify_name("Old_Chair", matchers) == 'props'
+        assert classify_name("Lamp_Chair", matchers) == 'props'
+        assert classify_name("Desk_Lamp", matchers) == 'lighting'
+        assert classify_name("Table", matchers) is None
+        assert classify_name("AxB", matchers) is None  # Keywords match literally
+        assert classify_name("", matchers) is None
+        print("✓ Patterns applied by confidence, ties in pattern order")
+
+        # Discovery skips hidden entries, skipped directories, small and non-blend files
+        print("Testing blend file discovery...")
+        def write(relative_path, size=2048):
+            path = os.path.join(pack_path, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(b"\0" * size)
+        write("a.blend")
+        write(os.path.join("sub", "b.BLEND"))
+        write("tiny.blend", size=10)
+        write("notes.txt")
+        write(".hidden.blend")
+        write(os.path.join(".git", "c.blend"))
+        write(os.path.join("Backup", "d.blend"))
+        write(os.path.join("cache", "e.blend"))
+        found = [os.path.relpath(path, pack_path) for path, _stat in scanner._find_blend_files(pack_path)]
+        assert found == ["a.blend", os.path.join("sub", "b.BLEND")], found
+        print(f"✓ Found {found}")
+
+        # Worker output: responses are found anywhere in a line, the rest is console output
+        print("Testing Blender worker output parsing...")
+        worker = asset_scanner.BlenderWorker("blender", "worker.py")
+        prefix = worker.RESPONSE_PREFIX.encode('utf-8')
+        class FakeProcess:
+            stdout = [
+                b"Blender 4.5 starting\n",
+                prefix + b'{"ready": true}\n',
+                b"Read blend: a.blend" + prefix + b'{"success": true}\n',
+                prefix + b"not json\n",
+            ]
+        responses = queue.Queue()
+        worker._read_output(FakeProcess(), responses)
+        parsed = [responses.get_nowait() for _ in range(4)]
+        assert parsed[:2] == [{"ready": True}, {"success": True}], parsed
+        assert parsed[2]['success'] is False and "Malformed" in parsed[2]['error'], parsed
+        assert parsed[3] is None, parsed  # End of output
+        assert list(worker._output_tail) == [b"Blender 4.5 starting", b"Read blend: a.blend"], worker._output_tail
+        print("✓ Responses parsed, console output kept for error reports")
+
+        print("\n✓ Scanner helpers test passed!")
+
+    except Exception as e:
+        print(f"\n✗ Scanner helpers test failed: {e!r}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        shutil.rmtree(pack_path, ignore_errors=True)
+        if os.path.exists(test_db_path):
+            os.remove(test_db_path)
+            print("✓ Test database cleaned up")
+
 def test_ui_integration():
     """Test UI integration with the scene properties."""
     print("="*50)
@@ -363,11 +620,23 @@ def run_tests():
     quick_database_test()
     print("\n")
     
-    # Test 3: UI integration test
+    # Test 3: Batch database operations used by the scanner
+    test_database_batch_operations()
+    print("\n")
+    
+    # Test 4: Scanner helpers
+    test_scanner_helpers()
+    print("\n")
+
+    # Test 5: Incremental rescans with a stubbed Blender worker
+    test_incremental_scan()
+    print("\n")
+
+    # Test 6: UI integration test
     test_ui_integration()
     print("\n")
     
-    # Test 4: Full scan test (optional - requires valid path)
+    # Test 7: Full scan test (optional - requires valid path)
     # Uncomment the next two lines and set a valid path to test full scanning
     # print("Full asset scan test skipped - set pack_to_scan_path to enable")
     # run_full_scan_test()
@@ -1,38 +1,72 @@
 # ui_panel.py - Optimized to eliminate redundant database queries
 import bpy
 from . import limit_manager
+from .properties import get_status, STYLES
 from datetime import datetime
 
+def _icon_id(name):
+    """Resolve an icon name to the integer ID accepted by icon_value=."""
+    return bpy.types.UILayout.bl_rna.functions['operator'].parameters['icon'].enum_items[name].value
+
+# Icons drawn on every redraw of the main panel, resolved once at import
+_ICON_PLAY = _icon_id('PLAY')
+_ICON_INFO = _icon_id('INFO')
+_ICON_CHECKMARK = _icon_id('CHECKMARK')
+_ICON_ERROR = _icon_id('ERROR')
+
+class VIEW3D_MT_ai_scene_style(bpy.types.Menu):
+    bl_label = "Style"
+    bl_idname = "VIEW3D_MT_ai_scene_style"
+
+    def draw(self, context):
+        layout = self.layout
+        for index, (_identifier, label, _description) in enumerate(STYLES):
+            op = layout.operator("wm.context_set_int", text=label)
+            op.data_path = "scene.my_tool_properties.scene_style"
+            op.value = index
+
+
 class VIEW3D_PT_ai_scene_generator(bpy.types.Panel):
     bl_label = "AI Scene Generator"
     bl_idname = "VIEW3D_PT_ai_scene_gen"
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = 'AI Gen'
+    bl_options = {'DEFAULT_CLOSED'}
 
     def draw(self, context):
         layout = self.layout
         props = context.scene.my_tool_properties
 
+        # Read each RNA value once per redraw
+        total_assets = props.total_assets_in_db
+        status_text = get_status(context.scene)
+
+        # One aligned column for the whole panel instead of a box per section
+        col = layout.column(align=True)
+
         # ===== SECTION 1: Scene Description =====
-        prompt_box = layout.box()
-        prompt_box.label(text="Scene Description", icon='TEXT')
-        prompt_box.scale_y = 1.3
-        prompt_box.prop(props, "prompt_input", text="")
+        col.label(text="Scene Description", icon='TEXT')
+        col.prop(props, "prompt_input", text="")
+        col.separator()
 
-        # Settings in a compact row
-        settings_row = layout.row(align=True)
-        settings_row.prop(props, "scene_style", text="Style")
-        settings_row.prop(props, "object_count", text="Count")
+        # scene_style is an index, so the style picker is a small menu
+        style_split = col.split(factor=0.4, align=True)
+        style_split.alignment = 'RIGHT'
+        style_split.label(text="Style")
+        style_split.menu(VIEW3D_MT_ai_scene_style.bl_idname, text=STYLES[props.scene_style][1])
+
+        col.use_property_split = True
+        col.use_property_decorate = False
+        col.prop(props, "object_count", text="Count")
 
         # ===== SECTION 2: Asset Library Status =====
-        asset_box = layout.box()
-        asset_box.label(text="Asset Library (Required)", icon='ASSET_MANAGER')
+        col.separator()
+        col.label(text="Asset Library (Required)", icon='ASSET_MANAGER')
 
         # Show asset pack status
-        if props.total_assets_in_db > 0:
-            status_row = asset_box.row()
-            status_row.label(text=f"✓ {props.total_assets_in_db} assets loaded", icon='CHECKMARK')
+        if total_assets > 0:
+            col.label(text=f"✓ {total_assets} assets loaded", icon='CHECKMARK')
 
             # Show matching count if filtered
             from .properties import get_cache_manager
@@ -40,50 +74,41 @@ class VIEW3D_PT_ai_scene_generator(bpy.types.Panel):
 
             if cache_manager.is_cache_valid():
                 cached_count = props.get_cached_asset_count()
-                if cached_count != props.total_assets_in_db:
-                    match_row = asset_box.row()
-                    match_row.label(text=f"Matching filters: {cached_count}", icon='FILTER')
+                if cached_count != total_assets:
+                    col.label(text=f"Matching filters: {cached_count}", icon='FILTER')
 
             # Asset filters - always visible since Asset Intelligence is mandatory
-            filter_col = asset_box.column(align=True)
-            filter_col.separator()
-            filter_col.label(text="Filters:")
-            filter_col.prop(props, "filter_category", text="Category")
-            filter_col.prop(props, "filter_quality", text="Quality")
-            filter_col.prop(props, "max_complexity", text="Complexity", slider=True)
+            col.prop(props, "filter_category", text="Category")
+            col.prop(props, "filter_quality", text="Quality")
+            col.prop(props, "max_complexity", text="Complexity", slider=True)
         else:
-            warning_box = asset_box.box()
-            warning_box.label(text="⚠ Asset Library Required", icon='ERROR')
-            warning_box.label(text="Scan an asset pack to begin")
-            action_row = asset_box.row()
-            action_row.scale_y = 1.3
-            action_row.operator("wm.scan_assets_operator", text="Scan Asset Pack", icon='FILE_FOLDER')
+            col.label(text="⚠ Asset Library Required", icon='ERROR')
+            col.label(text="Scan an asset pack to begin")
+            col.operator("wm.scan_assets_operator", text="Scan Asset Pack", icon='FILE_FOLDER')
 
         # ===== SECTION 3: Generate Button =====
-        gen_box = layout.box()
-        gen_box.scale_y = 2.0
+        col.separator()
 
-        if props.total_assets_in_db == 0:
-            gen_box.enabled = False
-            gen_box.label(text="⚠ Scan assets first to generate", icon='INFO')
+        if total_assets == 0:
+            col.label(text="⚠ Scan assets first to generate", icon_value=_ICON_INFO)
         else:
-            gen_box.operator("wm.generate_scene_operator", text="🚀 Generate Scene", icon='PLAY')
+            # Own row only so the button can be scaled up
+            gen_row = col.row()
+            gen_row.scale_y = 2.0
+            gen_row.operator("wm.generate_scene_operator", text="🚀 Generate Scene", icon_value=_ICON_PLAY)
 
         # ===== SECTION 4: Status & Usage =====
-        status_box = layout.box()
+        col.separator()
 
         # Status with appropriate icon
-        status_row = status_box.row()
-        status_icon = 'CHECKMARK' if "Complete" in props.status_text else 'ERROR' if "Error" in props.status_text else 'INFO'
-        status_row.label(text=f"Status: {props.status_text}", icon=status_icon)
+        status_icon = _ICON_CHECKMARK if "Complete" in status_text else _ICON_ERROR if "Error" in status_text else _ICON_INFO
+        col.label(text=f"Status: {status_text}", icon_value=status_icon)
 
         # Usage tracker
-        usage_row = status_box.row()
-        usage_row.label(text=f"Usage: {props.requests_today}/{limit_manager.RPD_LIMIT} today", icon='SORTTIME')
+        col.label(text=f"Usage: {props.requests_today}/{limit_manager.RPD_LIMIT} today", icon='SORTTIME')
 
         if props.cooldown_timer > 0:
-            cooldown_row = status_box.row()
-            cooldown_row.label(text=f"Cooldown: {props.cooldown_timer}s", icon='TIME')
+            col.label(text=f"Cooldown: {props.cooldown_timer}s", icon='TIME')
 
 
 class VIEW3D_PT_asset_intelligence(bpy.types.Panel):
@@ -230,14 +255,10 @@ class WM_OT_refresh_asset_cache_operator(bpy.types.Operator):
         return {'FINISHED'}
 
 
-def register():
-    bpy.utils.register_class(VIEW3D_PT_ai_scene_generator)
-    bpy.utils.register_class(VIEW3D_PT_asset_intelligence)
-    bpy.utils.register_class(VIEW3D_PT_asset_browser)
-    bpy.utils.register_class(WM_OT_refresh_asset_cache_operator)
-
-def unregister():
-    bpy.utils.unregister_class(WM_OT_refresh_asset_cache_operator)
-    bpy.utils.unregister_class(VIEW3D_PT_asset_browser)
-    bpy.utils.unregister_class(VIEW3D_PT_asset_intelligence)
-    bpy.utils.unregister_class(VIEW3D_PT_ai_scene_generator)
\ No newline at end of file
+classes = (
+    VIEW3D_MT_ai_scene_style,
+    VIEW3D_PT_ai_scene_generator,
+    VIEW3D_PT_asset_intelligence,
+    VIEW3D_PT_asset_browser,
+    WM_OT_refresh_asset_cache_operator,
+)